@@ -0,0 +1,144 @@
+"""Shared camera enumeration for Count-Cups."""
+
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from app.core.logging import get_logger
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None  # type: ignore[assignment]
+
+logger = get_logger(__name__)
+
+# Probing opens every candidate device, which can take seconds per
+# index on some backends, so results are cached for a short TTL and
+# shared by every screen that needs the list
+_CACHE_TTL_SECONDS = 60.0
+_MAX_CAMERAS = 5
+
+_lock = threading.Lock()
+_cached_indices: list[int] | None = None
+_cached_at = 0.0
+
+
+def capture_backend() -> int:
+    """Pick the OS-native capture backend.
+
+    The default backend can negotiate slow formats (raw YUYV on V4L2,
+    legacy DirectShow paths on Windows); naming the native one avoids
+    that.
+
+    Returns:
+        cv2.CAP_* backend constant
+    """
+    if sys.platform.startswith("linux"):
+        return cv2.CAP_V4L2
+    # mypy narrows sys.platform to the checking platform, so the other
+    # OS branches look unreachable to it
+    if os.name == "nt":  # type: ignore[unreachable]
+        return cv2.CAP_DSHOW
+    if sys.platform == "darwin":
+        return cv2.CAP_AVFOUNDATION
+    return cv2.CAP_ANY
+
+
+def list_cameras(force: bool = False) -> list[int]:
+    """Get the indices of cameras that deliver frames.
+
+    Results are cached for a short TTL so repeated lookups (live
+    camera, settings) only probe the hardware once.
+
+    Args:
+        force: Re-probe even if a cached result is still fresh
+
+    Returns:
+        Working camera indices, lowest first
+    """
+    global _cached_indices, _cached_at
+
+    with _lock:
+        if (
+            not force
+            and _cached_indices is not None
+            and time.monotonic() - _cached_at < _CACHE_TTL_SECONDS
+        ):
+            return list(_cached_indices)
+
+        indices = _probe()
+        _cached_indices = indices
+        _cached_at = time.monotonic()
+        return list(indices)
+
+
+def _probe() -> list[int]:
+    """Open each candidate index and keep the ones that deliver frames.
+
+    Returns:
+        Working camera indices
+    """
+    if cv2 is None:
+        return []  # type: ignore[unreachable]
+
+    backend = capture_backend()
+    found: list[int] = []
+
+    for i in range(_MAX_CAMERAS):
+        try:
+            cap = cv2.VideoCapture(i, backend)
+            if cap.isOpened():
+                ret, frame = cap.read()
+                if ret and frame is not None:
+                    found.append(i)
+            cap.release()
+        except Exception:
+            # Skip this camera index if there's an error
+            continue
+
+    return found
+
+
+class _ProbeSignals(QObject):
+    """Signals for background camera probes."""
+
+    cameras_found = pyqtSignal(list)
+
+
+class CameraProbeWorker(QRunnable):
+    """Probes cameras on the thread pool and reports via signal."""
+
+    def __init__(self, force: bool = False):
+        """Initialize probe worker.
+
+        Args:
+            force: Re-probe even if a cached result is still fresh
+        """
+        super().__init__()
+        self.force = force
+        self.signals = _ProbeSignals()
+
+    def run(self) -> None:
+        """Probe and emit the working camera indices."""
+        self.signals.cameras_found.emit(list_cameras(self.force))
+
+
+def probe_async(
+    callback: Callable[[list[int]], None], force: bool = False
+) -> None:
+    """Probe cameras on the global thread pool.
+
+    Args:
+        callback: Slot receiving the list of working camera indices
+        force: Re-probe even if a cached result is still fresh
+    """
+    worker = CameraProbeWorker(force)
+    worker.signals.cameras_found.connect(callback)
+    pool = QThreadPool.globalInstance()
+    assert pool is not None, "Global thread pool must be available"
+    pool.start(worker)
@@ -1,7 +1,7 @@
 """Database operations and migrations."""
 
 import sqlite3
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -30,6 +30,15 @@ class Database:
         """
         self.db_path = db_path or settings.get_database_path()
         self.connection: sqlite3.Connection | None = None
+
+        # Daily stats are immutable once computed until a write touches
+        # that day, so cache them and invalidate on write
+        self._daily_stats_cache: dict[date, DailyStats] = {}
+
+        # The single user-settings row changes only through
+        # update_user_settings, so cache it the same way
+        self._user_settings_cache: UserSettings | None = None
+
         self._ensure_database()
 
     @property
@@ -42,12 +51,17 @@ class Database:
 
     def _ensure_database(self) -> None:
         """Ensure database file exists and run migrations."""
-        # Ensure parent directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Connect to database
-        self.connection = sqlite3.connect(str(self.db_path))
+        # Ensure parent directory exists; ":memory:" databases (used by
+        # the tests) have no backing file
+        if str(self.db_path) != ":memory:":
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Connect to database; the connection is long-lived and shared
+        # across threads (sqlite3 serializes access), and WAL mode lets
+        # readers proceed while a write is in flight
+        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
         self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
 
         # Run migrations
         self._run_migrations()
@@ -313,10 +327,45 @@ class Database:
             ),
         )
         self.conn.commit()
+        self._daily_stats_cache.pop(event.timestamp.date(), None)
         rowid = cursor.lastrowid
         assert rowid is not None, "Failed to get lastrowid"
         return rowid
 
+    def create_sip_events_many(self, events: list[SipEvent]) -> None:
+        """Create multiple sip events in a single transaction.
+
+        One commit (and one fsync) covers the whole batch instead of one
+        per event.
+
+        Args:
+            events: Sip events to insert
+        """
+        if not events:
+            return
+
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            """
+            INSERT INTO sip_events (timestamp, profile_id, ml_estimate, source, confidence, detection_data)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            [
+                (
+                    event.timestamp,
+                    event.profile_id,
+                    event.ml_estimate,
+                    str(event.source),
+                    event.confidence,
+                    event.detection_data,
+                )
+                for event in events
+            ],
+        )
+        self.conn.commit()
+        for event in events:
+            self._daily_stats_cache.pop(event.timestamp.date(), None)
+
     def get_sip_events(
         self,
         start_date: datetime | None = None,
@@ -421,11 +470,19 @@ class Database:
             ),
         )
         self.conn.commit()
+        self._daily_stats_cache.pop(goal.date.date(), None)
         return cursor.rowcount > 0
 
     # Statistics Operations
     def get_daily_stats(self, target_date: date) -> DailyStats:
-        """Get daily statistics for a date."""
+        """Get daily statistics for a date.
+
+        Results are cached per day; writes to a day evict its entry.
+        """
+        cached = self._daily_stats_cache.get(target_date)
+        if cached is not None:
+            return cached
+
         cursor = self.conn.cursor()
 
         # Get events for the day
@@ -457,7 +514,7 @@ class Database:
             (total_ml / goal.target_ml * 100) if goal.target_ml > 0 else 0
         )
 
-        return DailyStats(
+        stats = DailyStats(
             date=start_datetime,
             total_ml=total_ml,
             total_sips=total_sips,
@@ -468,12 +525,86 @@ class Database:
             streak_days=goal.streak_days,
             events=events,
         )
+        if len(self._daily_stats_cache) >= 512:
+            # Evict the oldest entry to keep the cache bounded
+            self._daily_stats_cache.pop(next(iter(self._daily_stats_cache)))
+        self._daily_stats_cache[target_date] = stats
+        return stats
+
+    def get_daily_stats_range(
+        self, start_date: date, end_date: date
+    ) -> dict[date, DailyStats]:
+        """Get daily statistics for every day in an inclusive date range.
+
+        Aggregates sip events with a single GROUP BY query instead of one
+        round trip per day; days without events are zero-filled.
+
+        Args:
+            start_date: First day of the range
+            end_date: Last day of the range
+
+        Returns:
+            Mapping of date to DailyStats, in chronological order
+        """
+        cursor = self.conn.cursor()
+
+        start_datetime = datetime.combine(start_date, datetime.min.time())
+        end_datetime = datetime.combine(end_date, datetime.max.time())
+
+        cursor.execute(
+            """
+            SELECT date(timestamp) AS day,
+                   SUM(ml_estimate) AS total_ml,
+                   COUNT(*) AS total_sips
+            FROM sip_events
+            WHERE timestamp >= ? AND timestamp <= ?
+            GROUP BY day
+        """,
+            (start_datetime, end_datetime),
+        )
+        totals = {
+            date.fromisoformat(row["day"]): (row["total_ml"], row["total_sips"])
+            for row in cursor.fetchall()
+        }
+
+        # Goals for the range in one trip; days without a stored goal fall
+        # back to the default target without creating rows
+        cursor.execute(
+            "SELECT * FROM daily_goals WHERE date >= ? AND date <= ?",
+            (start_datetime, end_datetime),
+        )
+        goals = {
+            goal.date.date(): goal
+            for goal in (DailyGoal(**dict(row)) for row in cursor.fetchall())
+        }
+        default_target = settings.default_cup_size_ml * 4  # 4 cups default
+
+        stats: dict[date, DailyStats] = {}
+        current_date = start_date
+        while current_date <= end_date:
+            total_ml, total_sips = totals.get(current_date, (0.0, 0))
+            goal = goals.get(current_date)
+            target_ml = goal.target_ml if goal else default_target
+
+            stats[current_date] = DailyStats(
+                date=datetime.combine(current_date, datetime.min.time()),
+                total_ml=total_ml,
+                total_sips=total_sips,
+                total_cups=total_ml / 250.0,
+                goal_ml=target_ml,
+                goal_achieved=total_ml >= target_ml,
+                progress_percentage=(
+                    (total_ml / target_ml * 100) if target_ml > 0 else 0
+                ),
+                streak_days=goal.streak_days if goal else 0,
+            )
+            current_date += timedelta(days=1)
+
+        return stats
 
     def get_weekly_stats(self, week_start: date) -> WeeklyStats:
         """Get weekly statistics starting from week_start."""
         # Calculate week end
-        from datetime import timedelta
-
         week_end = week_start + timedelta(days=6)
 
         # Get daily stats for the week
@@ -519,12 +650,16 @@ class Database:
     # User Settings Operations
     def get_user_settings(self) -> UserSettings:
         """Get user settings (creates default if not exists)."""
+        if self._user_settings_cache is not None:
+            return self._user_settings_cache
+
         cursor = self.conn.cursor()
         cursor.execute("SELECT * FROM user_settings WHERE id = 1")
         row = cursor.fetchone()
 
         if row:
-            return UserSettings(**dict(row))
+            self._user_settings_cache = UserSettings(**dict(row))
+            return self._user_settings_cache
 
         # Create default settings
         settings_obj = UserSettings()
@@ -559,6 +694,7 @@ class Database:
         self.conn.commit()
 
         settings_obj.id = 1
+        self._user_settings_cache = settings_obj
         return settings_obj
 
     def update_user_settings(self, settings_obj: UserSettings) -> bool:
@@ -607,4 +743,5 @@ class Database:
             ),
         )
         self.conn.commit()
+        self._user_settings_cache = None
         return cursor.rowcount > 0
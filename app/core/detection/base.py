@@ -72,6 +72,12 @@ class HeuristicDetector(DetectionEngine):
         self.lower_skin = np.array([0, 20, 70], dtype=np.uint8)
         self.upper_skin = np.array([20, 255, 255], dtype=np.uint8)
 
+        # Morphology kernel and mask scratch buffers reused across
+        # frames; the buffers are sized lazily from the first frame
+        self._morph_kernel = np.ones((5, 5), np.uint8)
+        self._mask_buf: np.ndarray | None = None
+        self._morph_buf: np.ndarray | None = None
+
     def detect(self, frame: np.ndarray) -> DetectionResult | None:
         """Detect sip events using heuristics."""
         import time
@@ -163,13 +169,23 @@ class HeuristicDetector(DetectionEngine):
         # Convert to HSV for better skin color detection
         hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
 
-        # Create mask for skin color
-        mask = cv2.inRange(hsv, self.lower_skin, self.upper_skin)
+        # (Re)size the scratch buffers on first use or resolution change
+        height, width = frame.shape[:2]
+        if self._mask_buf is None or self._mask_buf.shape != (height, width):
+            self._mask_buf = np.empty((height, width), np.uint8)
+            self._morph_buf = np.empty((height, width), np.uint8)
+
+        # Create mask for skin color, writing into the reused buffers
+        mask = cv2.inRange(hsv, self.lower_skin, self.upper_skin, dst=self._mask_buf)
 
-        # Apply morphological operations to clean up the mask
-        kernel = np.ones((5, 5), np.uint8)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+        # Apply morphological operations to clean up the mask,
+        # ping-ponging between the two buffers to avoid aliasing
+        mask = cv2.morphologyEx(
+            mask, cv2.MORPH_OPEN, self._morph_kernel, dst=self._morph_buf
+        )
+        mask = cv2.morphologyEx(
+            mask, cv2.MORPH_CLOSE, self._morph_kernel, dst=self._mask_buf
+        )
 
         # Find contours
         contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -177,16 +193,28 @@ class HeuristicDetector(DetectionEngine):
         if not contours:
             return None
 
-        # Get the largest contour (likely the hand)
-        largest_contour = max(contours, key=cv2.contourArea)
+        # Degenerate contours (fewer than 3 points) cannot enclose any
+        # area; drop them cheaply before the per-contour moments call.
+        # Note point count does not bound area under CHAIN_APPROX_SIMPLE
+        # (a 4-point rectangle can be huge), so no tighter pre-filter
+        # is safe.
+        candidates = [contour for contour in contours if len(contour) >= 3]
+        if not candidates:
+            return None
+
+        # One moments call per contour yields both area (m00) and the
+        # centroid, replacing separate contourArea + boundingRect passes
+        best = None
+        for contour in candidates:
+            moments = cv2.moments(contour)
+            if best is None or moments["m00"] > best["m00"]:
+                best = moments
 
-        # Check if contour is large enough
-        if cv2.contourArea(largest_contour) < 1000:
+        # Check if contour is large enough (likely the hand)
+        if best is None or best["m00"] < 1000:
             return None
 
-        # Get bounding rectangle and return center
-        x, y, w, h = cv2.boundingRect(largest_contour)
-        return (x + w // 2, y + h // 2)
+        return (int(best["m10"] / best["m00"]), int(best["m01"] / best["m00"]))
 
     def _calculate_head_tilt(self, face: tuple[int, int, int, int]) -> float:
         """Calculate head tilt angle (simplified)."""
@@ -1,11 +1,14 @@
 """Heuristic-based detection implementation."""
 
+import math
+import os
 from typing import Any
 
 import cv2
 import numpy as np
 
 from app.core.detection.base import HeuristicDetector
+from app.core.detection.heuristics_kernel import sip_confidence
 from app.core.models import DetectionResult
 
 
@@ -21,10 +24,47 @@ class AdvancedHeuristicDetector(HeuristicDetector):
         self.contour_min_area = kwargs.get("contour_min_area", 1000)
         self.contour_max_area = kwargs.get("contour_max_area", 50000)
 
-        # Motion detection
-        self.prev_gray: np.ndarray | None = None
+        # Plausible on-screen head size as a fraction of frame height;
+        # bounds the cascade's scale sweep to the webcam use case
+        self.min_face_frac = kwargs.get("min_face_frac", 0.15)
+        self.max_face_frac = kwargs.get("max_face_frac", 0.6)
+
+        # Motion detection: diff against an exponential-moving-average
+        # reference rather than the single previous frame, which is far
+        # less sensitive to sensor noise
+        self.ref_gray: np.ndarray | None = None
+        self.motion_alpha = kwargs.get("motion_alpha", 0.2)
         self.flow_threshold = 10.0
 
+        # Static-frame pre-filter: when a small thumbnail of the frame
+        # barely changes, the cascade is skipped and the last face
+        # rectangles are reused
+        self.static_eps = kwargs.get("static_eps", 2.0)
+        self._prev_gray_small: np.ndarray | None = None
+        self._last_faces: list[tuple[int, int, int, int]] = []
+
+        # After several consecutive skin-color successes, a transient
+        # miss skips the expensive contour/edge fallbacks for a frame
+        self._skin_streak = 0
+        self._skin_streak_skip = kwargs.get("skin_streak_skip", 5)
+
+        # Shape-derived cascade bounds, specialized once per session on
+        # the first frame (webcam resolution is fixed for a session)
+        self._frame_shape: tuple[int, int] | None = None
+        self._cascade_min = 0
+        self._cascade_max = 0
+        self._cascade_small_min = 24
+
+        # Route the Haar cascade through the OpenCL T-API when a device
+        # is available; the sliding-window evaluation dominates frame
+        # cost and offloads cleanly via UMat
+        self._use_opencl = bool(cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL())
+
+        # Let OpenCV's internal pool use all cores but one, keeping a
+        # core free for the Qt event loop
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(max(1, (os.cpu_count() or 2) - 1))
+
         # Optical flow parameters
         self.lk_params = {
             "winSize": (15, 15),
@@ -45,20 +85,35 @@ class AdvancedHeuristicDetector(HeuristicDetector):
         # Convert to grayscale for motion detection
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
-        # Detect face
-        faces = self.face_cascade.detectMultiScale(gray, 1.1, 4)
+        # Cheap temporal pre-filter: diff an 80x60 thumbnail against the
+        # previous frame's and skip the cascade when the scene is
+        # essentially static — quiescent seconds cost almost nothing
+        gray_small = cv2.resize(gray, (80, 60), interpolation=cv2.INTER_AREA)
+        is_static = (
+            self._prev_gray_small is not None
+            and cv2.absdiff(gray_small, self._prev_gray_small).mean()
+            < self.static_eps
+        )
+        self._prev_gray_small = gray_small
+
+        if is_static:
+            faces = self._last_faces
+        else:
+            # Detect faces with the two-pass cascade strategy
+            faces = self._detect_faces(gray)
+            self._last_faces = faces
+
         if len(faces) == 0:
             return None
 
         # Use largest face
-        face = max(faces, key=lambda x: x[2] * x[3])
-        x, y, w, h = int(face[0]), int(face[1]), int(face[2]), int(face[3])
+        face_tuple = max(faces, key=lambda f: f[2] * f[3])
+        x, y, w, h = face_tuple
         face_center = (x + w // 2, y + h // 2)
-        # Convert face to tuple for type safety
-        face_tuple: tuple[int, int, int, int] = (x, y, w, h)
 
-        # Detect hand using multiple methods
-        hand_center = self._detect_hand_advanced(frame, face_tuple)
+        # Detect hand using multiple methods, reusing the grayscale
+        # conversion computed above
+        hand_center = self._detect_hand_advanced(frame, gray, face_tuple)
 
         if hand_center is None:
             return None
@@ -125,38 +180,118 @@ class AdvancedHeuristicDetector(HeuristicDetector):
                 self.sip_in_progress = False
                 self.detection_frames = []
 
-        # Update previous frame for motion detection
-        self.prev_gray = gray.copy()
-
         return None
 
+    def _specialize(self, shape: tuple[int, int]) -> None:
+        """Precompute shape-derived constants for a capture session.
+
+        Args:
+            shape: Grayscale frame shape (height, width)
+        """
+        self._frame_shape = shape
+        height = shape[0]
+
+        # A sipping user's head spans a bounded fraction of the frame,
+        # so restrict the cascade's scale sweep to that range
+        self._cascade_min = int(height * self.min_face_frac)
+        self._cascade_max = int(height * self.max_face_frac)
+        self._cascade_small_min = max(24, self._cascade_min // 4)
+
+    def _detect_faces(self, gray: np.ndarray) -> list[tuple[int, int, int, int]]:
+        """Detect faces with a downscale-then-refine cascade strategy.
+
+        The first cascade pass runs on a quarter-scale image (~16x less
+        integral-image area), then each candidate is re-detected on its
+        full-resolution region expanded by ~20%.
+
+        Args:
+            gray: Full-resolution grayscale frame
+
+        Returns:
+            List of (x, y, w, h) face rectangles in frame coordinates
+        """
+        if gray.shape[:2] != self._frame_shape:
+            self._specialize(gray.shape[:2])
+        min_size = self._cascade_min
+        max_size = self._cascade_max
+        small_min = self._cascade_small_min
+
+        small = cv2.resize(
+            gray, (0, 0), fx=0.25, fy=0.25, interpolation=cv2.INTER_AREA
+        )
+        # The installed cv2 stubs have no ndarray -> UMat overload
+        cascade_input = (
+            cv2.UMat(small) if self._use_opencl else small  # type: ignore[call-overload]
+        )
+        candidates = self.face_cascade.detectMultiScale(
+            cascade_input,
+            scaleFactor=1.25,
+            minNeighbors=5,
+            minSize=(small_min, small_min),
+            maxSize=(max_size // 4, max_size // 4),
+        )
+
+        faces: list[tuple[int, int, int, int]] = []
+        for candidate in candidates:
+            cx, cy, cw, ch = (int(value) * 4 for value in candidate)
+
+            # Expand the candidate by ~20% and clamp to the frame
+            margin_x, margin_y = cw // 5, ch // 5
+            roi_x = max(0, cx - margin_x)
+            roi_y = max(0, cy - margin_y)
+            roi_w = min(gray.shape[1] - roi_x, cw + 2 * margin_x)
+            roi_h = min(gray.shape[0] - roi_y, ch + 2 * margin_y)
+
+            roi = gray[roi_y : roi_y + roi_h, roi_x : roi_x + roi_w]
+            roi_input = (
+                cv2.UMat(roi) if self._use_opencl else roi  # type: ignore[call-overload]
+            )
+            refined = self.face_cascade.detectMultiScale(
+                roi_input, 1.1, 4, minSize=(min_size, min_size)
+            )
+
+            for rect in refined:
+                rx, ry, rw, rh = (int(value) for value in rect)
+                faces.append((roi_x + rx, roi_y + ry, rw, rh))
+
+        return faces
+
     def _detect_hand_advanced(
-        self, frame: np.ndarray, face: tuple[int, int, int, int]
+        self, frame: np.ndarray, gray: np.ndarray, face: tuple[int, int, int, int]
     ) -> tuple[int, int] | None:
-        """Advanced hand detection using multiple methods."""
-        x, y, w, h = face
-
-        # Method 1: Skin color detection
-        hand_center_skin = self._detect_hand_by_skin_color(frame)
+        """Advanced hand detection using multiple methods.
+
+        Args:
+            frame: BGR frame
+            gray: Grayscale conversion of the same frame, computed once
+                per detect() call and shared by the helpers
+            face: Face rectangle (x, y, w, h)
+        """
+        # Method 1: skin color — the cheapest and the preferred result,
+        # so the fallbacks only run when it misses
+        hand_center = self._detect_hand_by_skin_color(frame)
+        if hand_center is not None:
+            self._skin_streak += 1
+            return hand_center
+
+        # After a run of skin-color successes a single miss is most
+        # likely transient (lighting flicker); skip the expensive
+        # Canny/findContours fallbacks for this frame
+        had_streak = self._skin_streak >= self._skin_streak_skip
+        self._skin_streak = 0
+        if had_streak:
+            return None
 
         # Method 2: Contour detection in face region
-        hand_center_contour = self._detect_hand_by_contours(frame, face)
+        hand_center = self._detect_hand_by_contours(gray, face)
+        if hand_center is not None:
+            return hand_center
 
         # Method 3: Edge detection
-        hand_center_edge = self._detect_hand_by_edges(frame, face)
-
-        # Combine results (prefer skin color detection)
-        if hand_center_skin:
-            return hand_center_skin
-        elif hand_center_contour:
-            return hand_center_contour
-        elif hand_center_edge:
-            return hand_center_edge
-
-        return None
+        return self._detect_hand_by_edges(gray, face)
 
     def _detect_hand_by_contours(
-        self, frame: np.ndarray, face: tuple[int, int, int, int]
+        self, gray: np.ndarray, face: tuple[int, int, int, int]
     ) -> tuple[int, int] | None:
         """Detect hand using contour analysis."""
         x, y, w, h = face
@@ -165,13 +300,10 @@ class AdvancedHeuristicDetector(HeuristicDetector):
         margin = 50
         roi_x = max(0, x - margin)
         roi_y = max(0, y - margin)
-        roi_w = min(frame.shape[1] - roi_x, w + 2 * margin)
-        roi_h = min(frame.shape[0] - roi_y, h + 2 * margin)
-
-        roi = frame[roi_y : roi_y + roi_h, roi_x : roi_x + roi_w]
+        roi_w = min(gray.shape[1] - roi_x, w + 2 * margin)
+        roi_h = min(gray.shape[0] - roi_y, h + 2 * margin)
 
-        # Convert to grayscale
-        gray_roi = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+        gray_roi = gray[roi_y : roi_y + roi_h, roi_x : roi_x + roi_w]
 
         # Apply Gaussian blur
         blurred = cv2.GaussianBlur(gray_roi, (5, 5), 0)
@@ -212,7 +344,7 @@ class AdvancedHeuristicDetector(HeuristicDetector):
         return (center_x, center_y)
 
     def _detect_hand_by_edges(
-        self, frame: np.ndarray, face: tuple[int, int, int, int]
+        self, gray: np.ndarray, face: tuple[int, int, int, int]
     ) -> tuple[int, int] | None:
         """Detect hand using edge detection."""
         x, y, w, h = face
@@ -221,13 +353,10 @@ class AdvancedHeuristicDetector(HeuristicDetector):
         margin = 100
         roi_x = max(0, x - margin)
         roi_y = max(0, y - margin)
-        roi_w = min(frame.shape[1] - roi_x, w + 2 * margin)
-        roi_h = min(frame.shape[0] - roi_y, h + 2 * margin)
-
-        roi = frame[roi_y : roi_y + roi_h, roi_x : roi_x + roi_w]
+        roi_w = min(gray.shape[1] - roi_x, w + 2 * margin)
+        roi_h = min(gray.shape[0] - roi_y, h + 2 * margin)
 
-        # Convert to grayscale
-        gray_roi = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+        gray_roi = gray[roi_y : roi_y + roi_h, roi_x : roi_x + roi_w]
 
         # Apply bilateral filter to reduce noise
         filtered = cv2.bilateralFilter(gray_roi, 9, 75, 75)
@@ -274,39 +403,22 @@ class AdvancedHeuristicDetector(HeuristicDetector):
     def _calculate_head_tilt_advanced(
         self, face: tuple[int, int, int, int], gray: np.ndarray
     ) -> float:
-        """Calculate head tilt using advanced methods."""
+        """Calculate head tilt from central moments of the face region.
+
+        The orientation of the intensity distribution has the closed
+        form 0.5 * atan2(-2*mu11, mu02 - mu20), so a single moments
+        pass replaces the former Canny + HoughLines pipeline.
+        """
         x, y, w, h = face
 
         # Extract face region
         face_roi = gray[y : y + h, x : x + w]
 
-        # Apply Hough line detection
-        edges = cv2.Canny(face_roi, 50, 150)
-        lines = cv2.HoughLines(edges, 1, np.pi / 180, threshold=50)
-
-        if lines is not None and len(lines) > 0:
-            # Calculate average angle of detected lines
-            angles = []
-            for line in lines:
-                line_data = line[0]  # type: ignore[index]
-                # line_data is a numpy array from cv2.HoughLines
-                # Type ignore needed because mypy doesn't recognize cv2 array types properly
-                if isinstance(line_data, np.ndarray) and line_data.size >= 2:
-                    theta = float(line_data[1])
-                    angle = float(np.degrees(theta))
-                elif isinstance(line_data, (list, tuple)) and len(line_data) >= 2:
-                    theta = float(line_data[1])
-                    angle = float(np.degrees(theta))
-                else:
-                    continue
-                # Normalize angle to -90 to 90 degrees
-                if angle > 90:
-                    angle -= 180
-                angles.append(angle)
-
-            if angles:
-                avg_angle = float(np.mean(angles))
-                return avg_angle
+        moments = cv2.moments(face_roi, binaryImage=False)
+        if moments["m00"] > 0:
+            return math.degrees(
+                0.5 * math.atan2(-2.0 * moments["mu11"], moments["mu02"] - moments["mu20"])
+            )
 
         # Fallback to simple method
         return self._calculate_head_tilt(face)
@@ -314,26 +426,28 @@ class AdvancedHeuristicDetector(HeuristicDetector):
     def _detect_motion_in_face_region(
         self, gray: np.ndarray, face: tuple[int, int, int, int]
     ) -> bool:
-        """Detect motion in the face region."""
-        if self.prev_gray is None:
+        """Detect motion in the face region against the EMA reference."""
+        if self.ref_gray is None:
+            # Seed the reference; motion cannot be judged yet
+            self.ref_gray = gray.astype(np.float32)
             return False
 
+        # Fold the current frame into the running reference
+        cv2.accumulateWeighted(gray, self.ref_gray, self.motion_alpha)
+
         x, y, w, h = face[0], face[1], face[2], face[3]
 
-        # Extract face region from current and previous frames
+        # Extract face region from current frame and reference
         face_roi = gray[y : y + h, x : x + w]
-        prev_face_roi = self.prev_gray[y : y + h, x : x + w]
+        ref_face_roi = cv2.convertScaleAbs(self.ref_gray[y : y + h, x : x + w])
 
         # Calculate absolute difference
-        diff = cv2.absdiff(face_roi, prev_face_roi)
+        diff = cv2.absdiff(face_roi, ref_face_roi)
 
-        # Apply threshold
-        _, thresh = cv2.threshold(diff, self.motion_threshold, 255, cv2.THRESH_BINARY)
-
-        # Calculate motion percentage
-        motion_pixels = np.sum(thresh > 0)
-        total_pixels = thresh.size
-        motion_percentage = motion_pixels / total_pixels
+        # Fused reduction: count pixels above the motion threshold in
+        # one pass instead of materialising a binary mask and then a
+        # boolean temp for the sum
+        motion_percentage = np.count_nonzero(diff > self.motion_threshold) / diff.size
 
         # Return True if motion is significant
         return bool(motion_percentage > 0.01)  # 1% of face region moving
@@ -346,34 +460,22 @@ class AdvancedHeuristicDetector(HeuristicDetector):
         sip_duration: float,
     ) -> float:
         """Calculate detection confidence based on multiple factors."""
-        confidence = 0.0
-
-        # Distance factor (closer is better)
-        distance_factor = max(
-            0, 1.0 - (hand_face_distance / self.hand_face_distance_threshold)
+        return float(
+            sip_confidence(
+                hand_face_distance,
+                head_tilt_angle,
+                motion_detected,
+                sip_duration,
+                self.hand_face_distance_threshold,
+                self.head_tilt_threshold,
+            )
         )
-        confidence += distance_factor * 0.3
-
-        # Tilt factor (more tilt is better)
-        tilt_factor = min(1.0, abs(head_tilt_angle) / self.head_tilt_threshold)
-        confidence += tilt_factor * 0.3
-
-        # Motion factor
-        if motion_detected:
-            confidence += 0.2
-
-        # Duration factor (optimal duration is better)
-        duration_factor = (
-            1.0 - abs(sip_duration - 2.0) / 2.0
-        )  # Optimal around 2 seconds
-        duration_factor = max(0, duration_factor)
-        confidence += duration_factor * 0.2
-
-        return float(min(1.0, confidence))
 
     def cleanup(self) -> None:
         """Clean up resources and reset state."""
         super().cleanup()
         self.detection_frames = []
         self.sip_in_progress = False
-        self.prev_gray = None
+        self.ref_gray = None
+        self._prev_gray_small = None
+        self._last_faces = []
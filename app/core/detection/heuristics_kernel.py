@@ -0,0 +1,88 @@
+"""Scalar math kernels for the heuristic detection pipeline.
+
+The per-frame numeric reductions live here, free of cv2 and Qt, so they
+can be JIT-compiled. Numba is optional: when installed the kernels are
+compiled with @njit(cache=True, fastmath=True) and warmed at import so
+the first frame never pays compilation; without it the plain Python
+definitions run unchanged.
+"""
+
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _maybe_jit(func: F) -> F:
+    """Compile a kernel with Numba when it is available.
+
+    Args:
+        func: Plain-Python kernel function
+
+    Returns:
+        Compiled kernel, or func unchanged without Numba
+    """
+    if njit is None:
+        return func
+    return cast(F, njit(cache=True, fastmath=True)(func))
+
+
+@_maybe_jit
+def sip_confidence(
+    hand_face_distance: float,
+    head_tilt_angle: float,
+    motion_detected: bool,
+    sip_duration: float,
+    distance_threshold: float,
+    tilt_threshold: float,
+) -> float:
+    """Score a detected sip from its measured features.
+
+    Args:
+        hand_face_distance: Hand-to-face center distance in pixels
+        head_tilt_angle: Head tilt in degrees
+        motion_detected: Whether motion was seen in the face region
+        sip_duration: Sip duration in seconds
+        distance_threshold: Configured hand-face distance threshold
+        tilt_threshold: Configured head tilt threshold
+
+    Returns:
+        Confidence in [0.0, 1.0]
+    """
+    confidence = 0.0
+
+    # Distance factor (closer is better)
+    distance_factor = 1.0 - hand_face_distance / distance_threshold
+    if distance_factor < 0.0:
+        distance_factor = 0.0
+    confidence += distance_factor * 0.3
+
+    # Tilt factor (more tilt is better)
+    tilt_factor = abs(head_tilt_angle) / tilt_threshold
+    if tilt_factor > 1.0:
+        tilt_factor = 1.0
+    confidence += tilt_factor * 0.3
+
+    # Motion factor
+    if motion_detected:
+        confidence += 0.2
+
+    # Duration factor (optimal around 2 seconds)
+    duration_factor = 1.0 - abs(sip_duration - 2.0) / 2.0
+    if duration_factor < 0.0:
+        duration_factor = 0.0
+    confidence += duration_factor * 0.2
+
+    if confidence > 1.0:
+        confidence = 1.0
+    return confidence
+
+
+if njit is not None:
+    # Warm the JIT at import so the first detection doesn't stall
+    sip_confidence(0.0, 0.0, True, 0.0, 1.0, 1.0)
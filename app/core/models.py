@@ -43,6 +43,11 @@ class CupProfile(BaseModel):
 
     model_config = ConfigDict(use_enum_values=True)
 
+    @property
+    def ml_per_sip(self) -> float:
+        """Milliliters per sip for this cup."""
+        return self.size_ml / self.sips_per_cup
+
 
 class SipEvent(BaseModel):
     """A single sip event."""
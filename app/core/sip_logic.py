@@ -1,7 +1,9 @@
 """Sip detection logic and aggregation."""
 
 import time
-from datetime import datetime, timedelta
+from array import array
+from bisect import bisect_left
+from datetime import datetime
 
 from app.core.logging import get_logger
 from app.core.models import CupProfile, DetectionResult, EventSource, SipEvent
@@ -47,6 +49,16 @@ class SipAggregator:
         Returns:
             SipEvent if sip is complete, None otherwise
         """
+        # Fast path: most frames carry no sip (or one below threshold)
+        # while no sip is in progress — bail before reading the clock
+        # or touching any state. When a sip IS in progress the full
+        # path must run so it can complete or time out.
+        if not self.is_sip_in_progress and (
+            not detection.has_sip
+            or detection.confidence < self.confidence_threshold
+        ):
+            return None
+
         current_time = time.time()
 
         # Check cooldown period
@@ -244,7 +256,7 @@ class CupConverter:
             return sip_event.ml_estimate
 
         # Fallback to profile-based estimate
-        return profile.size_ml / profile.sips_per_cup
+        return profile.ml_per_sip
 
 
 class SipTracker:
@@ -269,6 +281,10 @@ class SipTracker:
         self.total_ml_today = 0.0
         self.sip_events_today: list[SipEvent] = []
 
+        # Sip timestamps (epoch seconds, append-only and sorted) so
+        # rate queries can binary-search instead of scanning the events
+        self._sip_timestamps = array("d")
+
         # Daily reset tracking
         self.last_reset_date = datetime.now().date()
 
@@ -305,6 +321,7 @@ class SipTracker:
             self.total_sips_today += 1
             self.total_ml_today += sip_event.ml_estimate
             self.sip_events_today.append(sip_event)
+            self._sip_timestamps.append(sip_event.timestamp.timestamp())
 
             logger.info(
                 f"Sip tracked: {sip_event.ml_estimate:.1f}ml (Total today: {self.total_ml_today:.1f}ml)"
@@ -339,6 +356,7 @@ class SipTracker:
         self.total_sips_today += 1
         self.total_ml_today += ml
         self.sip_events_today.append(sip_event)
+        self._sip_timestamps.append(sip_event.timestamp.timestamp())
 
         logger.info(
             f"Manual sip added: {ml:.1f}ml (Total today: {self.total_ml_today:.1f}ml)"
@@ -372,6 +390,7 @@ class SipTracker:
             self.total_sips_today = 0
             self.total_ml_today = 0.0
             self.sip_events_today = []
+            self._sip_timestamps = array("d")
             self.last_reset_date = current_date
 
             logger.info("Daily statistics reset")
@@ -381,6 +400,7 @@ class SipTracker:
         self.total_sips_today = 0
         self.total_ml_today = 0.0
         self.sip_events_today = []
+        self._sip_timestamps = array("d")
         self.last_reset_date = datetime.now().date()
 
         logger.info("Daily statistics manually reset")
@@ -394,16 +414,18 @@ class SipTracker:
         Returns:
             Sips per hour
         """
-        if not self.sip_events_today:
+        if not self._sip_timestamps:
             return 0.0
 
-        cutoff_time = datetime.now() - timedelta(minutes=window_minutes)
-        recent_sips = [
-            event for event in self.sip_events_today if event.timestamp >= cutoff_time
-        ]
+        # Timestamps are sorted, so the window boundary is a binary
+        # search rather than a scan over today's events
+        cutoff = time.time() - window_minutes * 60.0
+        recent_count = len(self._sip_timestamps) - bisect_left(
+            self._sip_timestamps, cutoff
+        )
 
-        if not recent_sips:
+        if recent_count == 0:
             return 0.0
 
         time_span_hours = window_minutes / 60.0
-        return len(recent_sips) / time_span_hours
+        return recent_count / time_span_hours
@@ -1,25 +1,55 @@
 """Scheduling service for Count-Cups."""
 
+import heapq
+import itertools
 import threading
 import time
 from collections.abc import Callable
-from datetime import datetime
+from datetime import datetime, timedelta
 from datetime import time as dt_time
+from types import MappingProxyType
+
+from PyQt6.QtCore import QTimer
 
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _msecs_until(run_time: dt_time) -> int:
+    """Milliseconds until the next occurrence of a time-of-day.
+
+    Args:
+        run_time: Time of day
+
+    Returns:
+        Milliseconds until the next occurrence
+    """
+    now = datetime.now()
+    fire = datetime.combine(now.date(), run_time)
+    if fire <= now:
+        fire += timedelta(days=1)
+    return int((fire - now).total_seconds() * 1000)
+
+
 class Scheduler:
     """Handles scheduled tasks and timers."""
 
+    # Process-lifetime counter so auto-generated task IDs never collide
+    _id_counter = itertools.count()
+
     def __init__(self):
         """Initialize scheduler."""
         self.tasks = {}
         self.running = False
         self.thread = None
         self._stop_event = threading.Event()
+        self._lock = threading.RLock()
+
+        # Daily tasks are bucketed by time-of-day; the heap holds one entry
+        # per distinct time so N reminders at the same HH:MM dispatch together
+        self._daily_buckets: dict[dt_time, list[str]] = {}
+        self._daily_heap: list[tuple[float, dt_time]] = []
 
     def start(self) -> None:
         """Start the scheduler."""
@@ -52,19 +82,29 @@ class Scheduler:
             try:
                 current_time = datetime.now()
 
-                # Check all tasks
-                for task_id, task in list(self.tasks.items()):
-                    if self._should_run_task(task, current_time):
-                        try:
-                            task["callback"]()
-                            logger.debug(f"Task {task_id} executed")
-                        except Exception as e:
-                            logger.error(f"Task {task_id} failed: {e}")
+                # Collect due tasks under the lock, run callbacks outside it
+                with self._lock:
+                    due = [
+                        (task_id, task)
+                        for task_id, task in self.tasks.items()
+                        if self._should_run_task(task, current_time)
+                    ]
 
-                        # Remove one-time tasks
+                    # Remove one-time tasks before releasing the lock
+                    for task_id, task in due:
                         if task["type"] == "once":
                             del self.tasks[task_id]
 
+                    # Daily tasks are dispatched from the time-of-day heap
+                    due.extend(self._pop_due_daily_tasks(current_time))
+
+                for task_id, task in due:
+                    try:
+                        task["callback"]()
+                        logger.debug(f"Task {task_id} executed")
+                    except Exception as e:
+                        logger.error(f"Task {task_id} failed: {e}")
+
                 # Sleep for a short interval
                 time.sleep(1)
 
@@ -84,16 +124,71 @@ class Scheduler:
         """
         if task["type"] == "once":
             return current_time >= task["run_time"]
-        elif task["type"] == "daily":
-            return (
-                current_time.time() >= task["run_time"]
-                and current_time.date() > task["last_run"]
-            )
         elif task["type"] == "interval":
             return (current_time - task["last_run"]).total_seconds() >= task["interval"]
 
         return False
 
+    def _pop_due_daily_tasks(self, current_time: datetime) -> list[tuple[str, dict]]:
+        """Pop daily tasks whose next fire time has passed.
+
+        Must be called with the lock held.
+
+        Args:
+            current_time: Current datetime
+
+        Returns:
+            List of (task_id, task) pairs ready to run
+        """
+        due: list[tuple[str, dict]] = []
+        now_epoch = current_time.timestamp()
+
+        while self._daily_heap and self._daily_heap[0][0] <= now_epoch:
+            next_fire, run_time = heapq.heappop(self._daily_heap)
+            bucket = self._daily_buckets.get(run_time)
+
+            if not bucket:
+                # All tasks at this time-of-day were cancelled
+                self._daily_buckets.pop(run_time, None)
+                continue
+
+            for task_id in bucket:
+                task = self.tasks.get(task_id)
+                if task:
+                    task["last_run"] = current_time.date()
+                    due.append((task_id, task))
+
+            # Reschedule the bucket for tomorrow; a plain float add avoids
+            # three datetime constructions per fire. Recompute only when a
+            # DST shift or clock jump makes the bumped value wrong.
+            next_fire += 86400.0
+            if (
+                next_fire <= now_epoch
+                or datetime.fromtimestamp(next_fire).time() != run_time
+            ):
+                next_fire = self._next_fire_epoch(run_time, current_time)
+            heapq.heappush(self._daily_heap, (next_fire, run_time))
+
+        return due
+
+    def _next_fire_epoch(
+        self, run_time: dt_time, after: datetime | None = None
+    ) -> float:
+        """Compute the next occurrence of a time-of-day as an epoch timestamp.
+
+        Args:
+            run_time: Time of day
+            after: Reference datetime (defaults to now)
+
+        Returns:
+            Epoch timestamp of the next occurrence
+        """
+        after = after or datetime.now()
+        fire = datetime.combine(after.date(), run_time)
+        if fire <= after:
+            fire += timedelta(days=1)
+        return fire.timestamp()
+
     def schedule_once(
         self, callback: Callable, run_time: datetime, task_id: str | None = None
     ) -> str:
@@ -108,14 +203,15 @@ class Scheduler:
             Task ID
         """
         if task_id is None:
-            task_id = f"once_{int(time.time())}"
+            task_id = f"once_{next(self._id_counter)}"
 
-        self.tasks[task_id] = {
-            "type": "once",
-            "callback": callback,
-            "run_time": run_time,
-            "last_run": None,
-        }
+        with self._lock:
+            self.tasks[task_id] = {
+                "type": "once",
+                "callback": callback,
+                "run_time": run_time,
+                "last_run": None,
+            }
 
         logger.info(f"Scheduled one-time task {task_id} for {run_time}")
         return task_id
@@ -134,14 +230,23 @@ class Scheduler:
             Task ID
         """
         if task_id is None:
-            task_id = f"daily_{run_time.strftime('%H%M')}"
-
-        self.tasks[task_id] = {
-            "type": "daily",
-            "callback": callback,
-            "run_time": run_time,
-            "last_run": datetime.now().date(),
-        }
+            task_id = f"daily_{run_time.strftime('%H%M')}_{next(self._id_counter)}"
+
+        with self._lock:
+            self.tasks[task_id] = {
+                "type": "daily",
+                "callback": callback,
+                "run_time": run_time,
+                "last_run": datetime.now().date(),
+            }
+
+            # A bucket has exactly one heap entry for its time-of-day
+            if run_time not in self._daily_buckets:
+                self._daily_buckets[run_time] = []
+                heapq.heappush(
+                    self._daily_heap, (self._next_fire_epoch(run_time), run_time)
+                )
+            self._daily_buckets[run_time].append(task_id)
 
         logger.info(f"Scheduled daily task {task_id} for {run_time}")
         return task_id
@@ -160,14 +265,15 @@ class Scheduler:
             Task ID
         """
         if task_id is None:
-            task_id = f"interval_{interval_seconds}s"
+            task_id = f"interval_{interval_seconds}s_{next(self._id_counter)}"
 
-        self.tasks[task_id] = {
-            "type": "interval",
-            "callback": callback,
-            "interval": interval_seconds,
-            "last_run": datetime.now(),
-        }
+        with self._lock:
+            self.tasks[task_id] = {
+                "type": "interval",
+                "callback": callback,
+                "interval": interval_seconds,
+                "last_run": datetime.now(),
+            }
 
         logger.info(
             f"Scheduled interval task {task_id} every {interval_seconds} seconds"
@@ -183,10 +289,19 @@ class Scheduler:
         Returns:
             True if task was cancelled, False if not found
         """
-        if task_id in self.tasks:
-            del self.tasks[task_id]
-            logger.info(f"Cancelled task {task_id}")
-            return True
+        with self._lock:
+            if task_id in self.tasks:
+                task = self.tasks.pop(task_id)
+
+                # Drop daily tasks from their time-of-day bucket; the heap
+                # entry is discarded lazily when the empty bucket next fires
+                if task["type"] == "daily":
+                    bucket = self._daily_buckets.get(task["run_time"])
+                    if bucket and task_id in bucket:
+                        bucket.remove(task_id)
+
+                logger.info(f"Cancelled task {task_id}")
+                return True
 
         return False
 
@@ -198,13 +313,13 @@ class Scheduler:
         """
         return len(self.tasks)
 
-    def get_tasks(self) -> dict:
+    def get_tasks(self) -> MappingProxyType:
         """Get all scheduled tasks.
 
         Returns:
-            Dictionary of task ID to task definition
+            Read-only view of task ID to task definition
         """
-        return self.tasks.copy()
+        return MappingProxyType(self.tasks)
 
 
 class DailyResetScheduler:
@@ -217,33 +332,36 @@ class DailyResetScheduler:
             reset_callback: Function to call for daily reset
         """
         self.reset_callback = reset_callback
-        self.scheduler = Scheduler()
-        self.task_id = None
+        self.run_time = dt_time(0, 0)  # 00:00
+        self._timer: QTimer | None = None
 
         # Schedule daily reset at midnight
         self.schedule_daily_reset()
 
     def schedule_daily_reset(self) -> None:
-        """Schedule daily reset at midnight."""
-        midnight = dt_time(0, 0)  # 00:00
-        self.task_id = self.scheduler.schedule_daily(
-            self._perform_daily_reset, midnight, "daily_reset"
-        )
+        """Schedule daily reset at midnight on the Qt event loop."""
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._perform_daily_reset)
+        self._timer.start(_msecs_until(self.run_time))
 
-        self.scheduler.start()
         logger.info("Daily reset scheduled for midnight")
 
     def _perform_daily_reset(self) -> None:
-        """Perform daily reset."""
+        """Perform daily reset and re-arm for tomorrow."""
         try:
             self.reset_callback()
             logger.info("Daily reset completed")
         except Exception as e:
             logger.error(f"Daily reset failed: {e}")
+        finally:
+            self.schedule_daily_reset()
 
     def stop(self) -> None:
         """Stop the scheduler."""
-        self.scheduler.stop()
+        if self._timer:
+            self._timer.stop()
+            self._timer = None
 
 
 class GoalReminderScheduler:
@@ -256,33 +374,36 @@ class GoalReminderScheduler:
             reminder_callback: Function to call for goal reminders
         """
         self.reminder_callback = reminder_callback
-        self.scheduler = Scheduler()
-        self.task_id = None
+        self.run_time = dt_time(20, 0)  # 8 PM
+        self._timer: QTimer | None = None
 
         # Schedule goal reminder at 8 PM
         self.schedule_goal_reminder()
 
     def schedule_goal_reminder(self) -> None:
-        """Schedule goal reminder at 8 PM."""
-        reminder_time = dt_time(20, 0)  # 8 PM
-        self.task_id = self.scheduler.schedule_daily(
-            self._perform_goal_reminder, reminder_time, "goal_reminder"
-        )
+        """Schedule goal reminder at 8 PM on the Qt event loop."""
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._perform_goal_reminder)
+        self._timer.start(_msecs_until(self.run_time))
 
-        self.scheduler.start()
         logger.info("Goal reminder scheduled for 8 PM")
 
     def _perform_goal_reminder(self) -> None:
-        """Perform goal reminder."""
+        """Perform goal reminder and re-arm for tomorrow."""
         try:
             self.reminder_callback()
             logger.info("Goal reminder sent")
         except Exception as e:
             logger.error(f"Goal reminder failed: {e}")
+        finally:
+            self.schedule_goal_reminder()
 
     def stop(self) -> None:
         """Stop the scheduler."""
-        self.scheduler.stop()
+        if self._timer:
+            self._timer.stop()
+            self._timer = None
 
 
 # Global scheduler instances
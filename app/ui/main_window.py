@@ -1,6 +1,10 @@
 """Main window for Count-Cups application."""
 
-from PyQt6.QtCore import pyqtSignal
+from datetime import date
+from functools import partial
+from importlib import import_module
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction, QActionGroup, QIcon, QKeySequence
 from PyQt6.QtWidgets import (
     QApplication,
@@ -21,15 +25,51 @@ from app.core.config import settings
 from app.core.db import Database
 from app.core.logging import get_logger
 from app.core.models import ThemeMode
-from app.ui.screens.calibration import CalibrationScreen
-from app.ui.screens.dashboard import DashboardScreen
-from app.ui.screens.history import HistoryScreen
-from app.ui.screens.live_cam import LiveCameraScreen
-from app.ui.screens.settings import SettingsScreen
 from app.ui.theme import ThemeManager
 
 logger = get_logger(__name__)
 
+# Screen navigation entries: (label, screen name, shortcut).
+# Drives both the View menu and the toolbar.
+SCREENS = (
+    ("Dashboard", "dashboard", "Ctrl+1"),
+    ("Live Camera", "live_cam", "Ctrl+2"),
+    ("History", "history", "Ctrl+3"),
+    ("Calibration", "calibration", "Ctrl+4"),
+    ("Settings", "settings", "Ctrl+5"),
+)
+
+
+class _PreloadSignals(QObject):
+    """Signals for background preload runnables."""
+
+    finished = pyqtSignal(object)
+
+
+class _DashboardPreload(QRunnable):
+    """Fetches today's stats off the GUI thread during startup."""
+
+    def __init__(self, db_path):
+        """Initialize preload runnable.
+
+        Args:
+            db_path: Path to the database file
+        """
+        super().__init__()
+        self.db_path = db_path
+        self.signals = _PreloadSignals()
+
+    def run(self) -> None:
+        """Load today's stats with a thread-local DB connection."""
+        daily_stats = None
+        try:
+            with Database(self.db_path) as database:
+                daily_stats = database.get_daily_stats(date.today())
+        except Exception as e:
+            logger.error(f"Dashboard preload failed: {e}")
+
+        self.signals.finished.emit(daily_stats)
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -38,6 +78,16 @@ class MainWindow(QMainWindow):
     theme_changed = pyqtSignal(str)
     detection_engine_changed = pyqtSignal(str)
 
+    # Screen classes are imported lazily so heavy dependencies (OpenCV,
+    # detection engines) don't load until their screen is first shown
+    _SCREEN_CLASSES = {
+        "dashboard": ("app.ui.screens.dashboard", "DashboardScreen"),
+        "live_cam": ("app.ui.screens.live_cam", "LiveCameraScreen"),
+        "history": ("app.ui.screens.history", "HistoryScreen"),
+        "calibration": ("app.ui.screens.calibration", "CalibrationScreen"),
+        "settings": ("app.ui.screens.settings", "SettingsScreen"),
+    }
+
     def __init__(self):
         """Initialize main window."""
         super().__init__()
@@ -45,7 +95,22 @@ class MainWindow(QMainWindow):
         # Initialize components
         self.database: Database | None = None
         self.theme_manager: ThemeManager | None = None
-        self.current_screen = "dashboard"
+        self.current_screen = ""
+        self._screen_map: dict[str, QWidget] = {}
+
+        # Coalesce bursts of sip events into one dashboard refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(250)
+        self._refresh_timer.timeout.connect(self._refresh_dashboard)
+
+        # Last persisted window geometry; closeEvent skips the DB write
+        # when nothing changed
+        self._persisted_geom = (
+            settings.window_width,
+            settings.window_height,
+            settings.window_maximized,
+        )
 
         # Initialize UI
         self._init_ui()
@@ -63,9 +128,6 @@ class MainWindow(QMainWindow):
 
         self._init_system_tray()
 
-        # Connect signals
-        self._connect_signals()
-
         # Apply initial settings
         self._apply_settings()
 
@@ -74,18 +136,20 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event) -> None:
         """Handle window close event."""
         # Save window state
+        current_geom = (self.width(), self.height(), self.isMaximized())
         settings.window_width = self.width()
         settings.window_height = self.height()
         settings.window_maximized = self.isMaximized()
 
-        # Save settings to database
-        if self.database:
+        # Save settings to database only when geometry actually changed
+        if self.database and current_geom != self._persisted_geom:
             try:
                 user_settings = self.database.get_user_settings()
                 user_settings.window_width = self.width()
                 user_settings.window_height = self.height()
                 user_settings.window_maximized = self.isMaximized()
                 self.database.update_user_settings(user_settings)
+                self._persisted_geom = current_geom
             except Exception as e:
                 logger.warning(f"Failed to save window state: {e}")
 
@@ -93,6 +157,12 @@ class MainWindow(QMainWindow):
         if hasattr(self, "live_cam_screen") and self.live_cam_screen:
             self.live_cam_screen.cleanup_camera()
 
+        # Flush the dashboard's queued sip writes before the database
+        # connection goes away
+        dashboard = self._screen_map.get("dashboard")
+        if dashboard:
+            dashboard.cleanup()
+
         # Close database connection
         if self.database:
             self.database.close()
@@ -147,29 +217,61 @@ class MainWindow(QMainWindow):
             self.theme_manager.theme_changed.connect(self._on_theme_changed)
 
     def _init_screens(self) -> None:
-        """Initialize all screens."""
-        # Dashboard screen
-        self.dashboard_screen = DashboardScreen(self.database, self)
-        self.screen_stack.addWidget(self.dashboard_screen)
+        """Initialize screens.
 
-        # Live camera screen
-        self.live_cam_screen = LiveCameraScreen(self.database, self)
-        self.screen_stack.addWidget(self.live_cam_screen)
+        Only the dashboard is constructed eagerly; the remaining screens
+        are created on demand the first time they are shown.
+        """
+        self._ensure_screen("dashboard")
 
-        # History screen
-        self.history_screen = HistoryScreen(self.database, self)
-        self.screen_stack.addWidget(self.history_screen)
+        # Show dashboard by default
+        self.show_screen("dashboard")
 
-        # Calibration screen
-        self.calibration_screen = CalibrationScreen(self.database, self)
-        self.screen_stack.addWidget(self.calibration_screen)
+        # Fetch the dashboard's initial data off the GUI thread so the
+        # first frame paints without waiting on the DB
+        self._start_preload()
 
-        # Settings screen
-        self.settings_screen = SettingsScreen(self.database, self)
-        self.screen_stack.addWidget(self.settings_screen)
+    def _start_preload(self) -> None:
+        """Start the background preload of today's stats."""
+        if not self.database:
+            return
 
-        # Show dashboard by default
-        self.show_screen("dashboard")
+        preload = _DashboardPreload(self.database.db_path)
+        preload.signals.finished.connect(self._on_preload_finished)
+        QThreadPool.globalInstance().start(preload)
+
+    def _on_preload_finished(self, daily_stats) -> None:
+        """Bind preloaded stats to the dashboard on the main thread.
+
+        Args:
+            daily_stats: Preloaded DailyStats, or None on failure
+        """
+        dashboard = self._screen_map.get("dashboard")
+        if dashboard and daily_stats is not None:
+            dashboard.populate(daily_stats)
+
+    def _ensure_screen(self, screen_name: str) -> QWidget:
+        """Get a screen widget, creating it on first use.
+
+        Args:
+            screen_name: Name of the screen
+
+        Returns:
+            The screen widget
+        """
+        screen = self._screen_map.get(screen_name)
+
+        if screen is None:
+            module_name, class_name = self._SCREEN_CLASSES[screen_name]
+            screen_cls = getattr(import_module(module_name), class_name)
+            screen = screen_cls(self.database, self)
+            self._screen_map[screen_name] = screen
+            setattr(self, f"{screen_name}_screen", screen)
+            self.screen_stack.addWidget(screen)
+            self._connect_screen_signals(screen_name, screen)
+            logger.debug(f"Screen {screen_name} created")
+
+        return screen
 
     def _init_menu(self) -> None:
         """Initialize menu bar."""
@@ -207,30 +309,11 @@ class MainWindow(QMainWindow):
         view_menu = menubar.addMenu("&View")
 
         # Screen navigation
-        dashboard_action = QAction("&Dashboard", self)
-        dashboard_action.setShortcut("Ctrl+1")
-        dashboard_action.triggered.connect(lambda: self.show_screen("dashboard"))
-        view_menu.addAction(dashboard_action)
-
-        live_cam_action = QAction("&Live Camera", self)
-        live_cam_action.setShortcut("Ctrl+2")
-        live_cam_action.triggered.connect(lambda: self.show_screen("live_cam"))
-        view_menu.addAction(live_cam_action)
-
-        history_action = QAction("&History", self)
-        history_action.setShortcut("Ctrl+3")
-        history_action.triggered.connect(lambda: self.show_screen("history"))
-        view_menu.addAction(history_action)
-
-        calibration_action = QAction("&Calibration", self)
-        calibration_action.setShortcut("Ctrl+4")
-        calibration_action.triggered.connect(lambda: self.show_screen("calibration"))
-        view_menu.addAction(calibration_action)
-
-        settings_action = QAction("&Settings", self)
-        settings_action.setShortcut("Ctrl+5")
-        settings_action.triggered.connect(lambda: self.show_screen("settings"))
-        view_menu.addAction(settings_action)
+        for label, screen_name, shortcut in SCREENS:
+            action = QAction(f"&{label}", self)
+            action.setShortcut(shortcut)
+            action.triggered.connect(partial(self.show_screen, screen_name))
+            view_menu.addAction(action)
 
         view_menu.addSeparator()
 
@@ -239,29 +322,12 @@ class MainWindow(QMainWindow):
 
         self.theme_group = QActionGroup(self)
 
-        auto_theme_action = QAction("&Auto", self)
-        auto_theme_action.setCheckable(True)
-        auto_theme_action.triggered.connect(lambda: self._set_theme("auto"))
-        self.theme_group.addAction(auto_theme_action)
-        theme_menu.addAction(auto_theme_action)
-
-        light_theme_action = QAction("&Light", self)
-        light_theme_action.setCheckable(True)
-        light_theme_action.triggered.connect(lambda: self._set_theme("light"))
-        self.theme_group.addAction(light_theme_action)
-        theme_menu.addAction(light_theme_action)
-
-        dark_theme_action = QAction("&Dark", self)
-        dark_theme_action.setCheckable(True)
-        dark_theme_action.triggered.connect(lambda: self._set_theme("dark"))
-        self.theme_group.addAction(dark_theme_action)
-        theme_menu.addAction(dark_theme_action)
-
-        dracula_theme_action = QAction("&Dracula", self)
-        dracula_theme_action.setCheckable(True)
-        dracula_theme_action.triggered.connect(lambda: self._set_theme("dracula"))
-        self.theme_group.addAction(dracula_theme_action)
-        theme_menu.addAction(dracula_theme_action)
+        for label in ("Auto", "Light", "Dark", "Dracula"):
+            action = QAction(f"&{label}", self)
+            action.setCheckable(True)
+            action.triggered.connect(partial(self._set_theme, label.lower()))
+            self.theme_group.addAction(action)
+            theme_menu.addAction(action)
 
         # Help menu
         help_menu = menubar.addMenu("&Help")
@@ -281,25 +347,10 @@ class MainWindow(QMainWindow):
         self.addToolBar(toolbar)
 
         # Screen navigation buttons
-        dashboard_btn = QPushButton("Dashboard")
-        dashboard_btn.clicked.connect(lambda: self.show_screen("dashboard"))
-        toolbar.addWidget(dashboard_btn)
-
-        live_cam_btn = QPushButton("Live Camera")
-        live_cam_btn.clicked.connect(lambda: self.show_screen("live_cam"))
-        toolbar.addWidget(live_cam_btn)
-
-        history_btn = QPushButton("History")
-        history_btn.clicked.connect(lambda: self.show_screen("history"))
-        toolbar.addWidget(history_btn)
-
-        calibration_btn = QPushButton("Calibration")
-        calibration_btn.clicked.connect(lambda: self.show_screen("calibration"))
-        toolbar.addWidget(calibration_btn)
-
-        settings_btn = QPushButton("Settings")
-        settings_btn.clicked.connect(lambda: self.show_screen("settings"))
-        toolbar.addWidget(settings_btn)
+        for label, screen_name, _ in SCREENS:
+            button = QPushButton(label)
+            button.clicked.connect(partial(self.show_screen, screen_name))
+            toolbar.addWidget(button)
 
         # Add separator
         toolbar.addSeparator()
@@ -361,17 +412,18 @@ class MainWindow(QMainWindow):
         else:
             self.tray_icon = None
 
-    def _connect_signals(self) -> None:
-        """Connect signals."""
-        # Connect screen signals
-        if hasattr(self, "live_cam_screen"):
-            self.live_cam_screen.camera_status_changed.connect(
-                self._on_camera_status_changed
-            )
-            self.live_cam_screen.sip_detected.connect(self._on_sip_detected)
+    def _connect_screen_signals(self, screen_name: str, screen: QWidget) -> None:
+        """Connect signals for a newly created screen.
 
-        if hasattr(self, "settings_screen"):
-            self.settings_screen.detection_engine_changed.connect(
+        Args:
+            screen_name: Name of the screen
+            screen: Screen widget
+        """
+        if screen_name == "live_cam":
+            screen.camera_status_changed.connect(self._on_camera_status_changed)
+            screen.sip_detected.connect(self._on_sip_detected)
+        elif screen_name == "settings":
+            screen.detection_engine_changed.connect(
                 self._on_detection_engine_changed
             )
 
@@ -391,16 +443,12 @@ class MainWindow(QMainWindow):
         Args:
             screen_name: Name of screen to show
         """
-        screen_map = {
-            "dashboard": self.dashboard_screen,
-            "live_cam": self.live_cam_screen,
-            "history": self.history_screen,
-            "calibration": self.calibration_screen,
-            "settings": self.settings_screen,
-        }
-
-        if screen_name in screen_map:
-            self.screen_stack.setCurrentWidget(screen_map[screen_name])
+        # Re-selecting the visible screen would only repaint the status bar
+        if screen_name == self.current_screen:
+            return
+
+        if screen_name in self._SCREEN_CLASSES:
+            self.screen_stack.setCurrentWidget(self._ensure_screen(screen_name))
             self.current_screen = screen_name
 
             # Update status label if it exists
@@ -459,9 +507,15 @@ class MainWindow(QMainWindow):
         """
         self.status_label.setText(f"Sip detected: {ml_amount:.1f}ml")
 
-        # Update dashboard if visible
+        # Update dashboard if visible (coalesced; restarting is idempotent)
         if self.current_screen == "dashboard":
-            self.dashboard_screen.refresh_data()
+            self._refresh_timer.start()
+
+    def _refresh_dashboard(self) -> None:
+        """Refresh the dashboard after a burst of sip events."""
+        dashboard = self._screen_map.get("dashboard")
+        if dashboard:
+            dashboard.refresh_data()
 
     def _on_detection_engine_changed(self, engine: str) -> None:
         """Handle detection engine change.
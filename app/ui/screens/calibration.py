@@ -1,5 +1,8 @@
 """Calibration screen for Count-Cups."""
 
+from datetime import datetime
+
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import (
     QCheckBox,
     QFormLayout,
@@ -17,6 +20,7 @@ from PyQt6.QtWidgets import (
 
 from app.core.db import Database
 from app.core.logging import get_logger
+from app.core.models import CupProfile
 
 logger = get_logger(__name__)
 
@@ -35,6 +39,12 @@ class CalibrationScreen(QWidget):
         self.database = database
         self.parent_window = parent
 
+        # One persistent timer for the test simulation instead of a
+        # QTimer.singleShot allocation per tick
+        self._test_timer = QTimer(self)
+        self._test_timer.setInterval(1000)
+        self._test_timer.timeout.connect(self._tick_test_progress)
+
         self._init_ui()
         self._load_cup_profiles()
 
@@ -189,33 +199,29 @@ class CalibrationScreen(QWidget):
         self.test_results.setText("Test in progress... Perform drinking gestures")
 
         # Simulate test progress
-        self._simulate_test_progress()
+        self._test_timer.start()
 
     def _stop_test(self) -> None:
         """Stop calibration test."""
+        self._test_timer.stop()
         self.start_test_btn.setEnabled(True)
         self.stop_test_btn.setEnabled(False)
         self.test_progress.setVisible(False)
         self.test_results.setText("Test stopped")
 
-    def _simulate_test_progress(self) -> None:
-        """Simulate test progress (placeholder)."""
-        import random
-
-        progress = random.randint(10, 90)
+    def _tick_test_progress(self) -> None:
+        """Advance the simulated test progress (placeholder)."""
+        progress = self.test_progress.value() + 10
         self.test_progress.setValue(progress)
 
-        if progress < 100:
-            # Continue test
-            from PyQt6.QtCore import QTimer
-
-            QTimer.singleShot(1000, self._simulate_test_progress)
-        else:
+        if progress >= 100:
             # Test complete
+            self._test_timer.stop()
             self.test_results.setText(
                 "Test completed! Detection sensitivity looks good."
             )
-            self.stop_test()
+            self.start_test_btn.setEnabled(True)
+            self.stop_test_btn.setEnabled(False)
 
     def _save_settings(self) -> None:
         """Save calibration settings."""
@@ -228,10 +234,6 @@ class CalibrationScreen(QWidget):
                 return
 
             # Create cup profile
-            from datetime import datetime
-
-            from app.core.models import CupProfile
-
             profile = CupProfile(
                 name=self.cup_name.text().strip(),
                 size_ml=self.cup_size.value(),
@@ -1,6 +1,6 @@
 """Dashboard screen for Count-Cups."""
 
-from datetime import date
+from datetime import date, datetime
 
 from PyQt6.QtCore import QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import (
     QGridLayout,
     QHBoxLayout,
     QLabel,
+    QMessageBox,
     QProgressBar,
     QPushButton,
     QScrollArea,
@@ -17,9 +18,45 @@ from PyQt6.QtWidgets import (
 
 from app.core.db import Database
 from app.core.logging import get_logger
+from app.core.models import EventSource, SipEvent
 
 logger = get_logger(__name__)
 
+# Stylesheets are constant, so build the strings once at import instead
+# of re-feeding Qt's CSS parser a fresh literal per widget
+_CARD_QSS = """
+    QFrame.card {
+        background-color: #1e1e1e;
+        border: 1px solid #333333;
+        border-radius: 8px;
+        padding: 16px;
+    }
+"""
+
+_PROGRESS_QSS = """
+    QProgressBar {
+        border: 2px solid #404040;
+        border-radius: 8px;
+        text-align: center;
+        font-weight: bold;
+        height: 24px;
+        background-color: #2a2a2a;
+    }
+    QProgressBar::chunk {
+        background-color: #3b82f6;
+        border-radius: 6px;
+    }
+"""
+
+_SCROLL_QSS = """
+    QScrollArea {
+        border: none;
+        background-color: transparent;
+    }
+"""
+
+_ACTIVITY_ITEM_QSS = "color: #ffffff; font-size: 12px; padding: 4px; background-color: #2a2a2a; border-radius: 4px; margin: 2px;"
+
 
 class DashboardScreen(QWidget):
     """Dashboard screen showing daily statistics and quick actions."""
@@ -38,12 +75,21 @@ class DashboardScreen(QWidget):
         self.database = database
         self.parent_window = parent
 
+        # Today's stats as last loaded; manual adds update this in-memory
+        self._today = None
+        self._last_render_sig = None
+
+        # Write-behind queue so rapid manual adds batch into a single
+        # transaction instead of one commit per click
+        self._pending: list[SipEvent] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(500)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
         self._init_ui()
         self._init_timer()
 
-        # Load initial data
-        self.refresh_data()
-
     def _init_ui(self) -> None:
         """Initialize UI components."""
         layout = QVBoxLayout(self)
@@ -95,20 +141,7 @@ class DashboardScreen(QWidget):
         self.goal_progress = QProgressBar()
         self.goal_progress.setRange(0, 100)
         self.goal_progress.setValue(0)
-        self.goal_progress.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #404040;
-                border-radius: 8px;
-                text-align: center;
-                font-weight: bold;
-                height: 24px;
-                background-color: #2a2a2a;
-            }
-            QProgressBar::chunk {
-                background-color: #3b82f6;
-                border-radius: 6px;
-            }
-        """)
+        self.goal_progress.setStyleSheet(_PROGRESS_QSS)
         progress_layout.addWidget(self.goal_progress)
 
         self.goal_label = QLabel("0% of daily goal")
@@ -163,6 +196,43 @@ class DashboardScreen(QWidget):
 
         layout.addLayout(stats_layout)
 
+        # Recent activity section
+        activity_card = self._create_card(
+            "Recent Activity", "Your latest hydration events"
+        )
+        # Get the layout from the card
+        card_layout = activity_card.layout()
+
+        self.activity_scroll = QScrollArea()
+        self.activity_scroll.setWidgetResizable(True)
+        self.activity_scroll.setMaximumHeight(200)
+        self.activity_scroll.setStyleSheet(_SCROLL_QSS)
+
+        self.activity_widget = QWidget()
+        self.activity_layout = QVBoxLayout(self.activity_widget)
+        self.activity_layout.setContentsMargins(0, 0, 0, 0)
+        self.activity_scroll.setWidget(self.activity_widget)
+
+        card_layout.addWidget(self.activity_scroll)
+        layout.addWidget(activity_card)
+
+        # Recycled labels for the recent-activity list; refreshes only
+        # call setText/show/hide instead of destroying and re-creating
+        # widgets every 30 seconds
+        self.no_activity_label = QLabel("No recent activity")
+        self.no_activity_label.setStyleSheet(
+            "color: #d0d0d0; font-size: 14px; padding: 8px;"
+        )
+        self.activity_layout.addWidget(self.no_activity_label)
+
+        self._activity_pool = [QLabel() for _ in range(5)]
+        for event_label in self._activity_pool:
+            event_label.setStyleSheet(_ACTIVITY_ITEM_QSS)
+            event_label.hide()
+            self.activity_layout.addWidget(event_label)
+
+        self._last_activity_texts: list[str] | None = None
+
     def _create_card(self, title: str, subtitle: str) -> QFrame:
         """Create a modern card widget.
 
@@ -175,14 +245,7 @@ class DashboardScreen(QWidget):
         """
         card = QFrame()
         card.setProperty("class", "card")
-        card.setStyleSheet("""
-            QFrame.card {
-                background-color: #1e1e1e;
-                border: 1px solid #333333;
-                border-radius: 8px;
-                padding: 16px;
-            }
-        """)
+        card.setStyleSheet(_CARD_QSS)
 
         layout = QVBoxLayout(card)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -200,56 +263,65 @@ class DashboardScreen(QWidget):
 
         return card
 
-        # Recent activity section
-        activity_card = self._create_card(
-            "Recent Activity", "Your latest hydration events"
-        )
-        # Get the layout from the card
-        activity_layout = activity_card.layout()
-
-        self.activity_list = QScrollArea()
-        self.activity_list.setWidgetResizable(True)
-        self.activity_list.setMaximumHeight(200)
-        self.activity_list.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
-
-        self.activity_widget = QWidget()
-        self.activity_layout = QVBoxLayout(self.activity_widget)
-        self.activity_layout.setContentsMargins(0, 0, 0, 0)
-        self.activity_list.setWidget(self.activity_widget)
-
-        activity_layout.addWidget(self.activity_list)
-        layout.addWidget(activity_card)
-
-        # Initialize activity list
-        self.activity_list = QLabel("No recent activity")
-        self.activity_list.setStyleSheet(
-            "color: #d0d0d0; font-size: 14px; padding: 8px;"
-        )
-        self.activity_list.setWordWrap(True)
-        self.activity_layout.addWidget(self.activity_list)
-
     def _init_timer(self) -> None:
-        """Initialize refresh timer."""
+        """Initialize refresh timer; show/hide events start and stop it."""
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.refresh_data)
+
+    def showEvent(self, event) -> None:
+        """Resume periodic refresh while the screen is visible."""
         self.refresh_timer.start(30000)  # Refresh every 30 seconds
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        """Pause periodic refresh while the screen is hidden."""
+        self.refresh_timer.stop()
+        super().hideEvent(event)
 
     def refresh_data(self) -> None:
         """Refresh dashboard data."""
-        if not self.database or not self.database.ensure_connection():
+        if not self.database:
             logger.warning("Database not available for refresh")
             return
 
+        # Persist queued adds first so the refresh sees them
+        self._flush_pending()
+
         try:
             # Get today's stats
             today = date.today()
             daily_stats = self.database.get_daily_stats(today)
+            self.populate(daily_stats)
+        except Exception as e:
+            logger.error(f"Failed to refresh dashboard data: {e}")
+
+    def populate(self, daily_stats) -> None:
+        """Apply daily stats to the widgets.
 
+        Called with preloaded data at startup and from refresh_data.
+
+        Args:
+            daily_stats: DailyStats for today
+        """
+        self._today = daily_stats
+
+        # Skip the rewrite entirely when nothing the widgets show has
+        # changed since the last render (common on idle refreshes)
+        render_sig = (
+            daily_stats.total_ml,
+            daily_stats.total_cups,
+            daily_stats.total_sips,
+            daily_stats.progress_percentage,
+            tuple((e.timestamp, e.ml_estimate) for e in daily_stats.events[-5:]),
+        )
+        if render_sig == self._last_render_sig:
+            return
+        self._last_render_sig = render_sig
+
+        # Suspend painting so the widget updates coalesce into one
+        # repaint instead of one per label
+        self.setUpdatesEnabled(False)
+        try:
             # Update labels
             self.today_ml_label.setText(f"{daily_stats.total_ml:.0f} ml")
             self.today_cups_label.setText(f"{daily_stats.total_cups:.1f} cups")
@@ -263,9 +335,56 @@ class DashboardScreen(QWidget):
 
             # Update recent activity
             self._update_activity_list(daily_stats.events)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _apply_local_sip(self, sip_event) -> None:
+        """Fold a just-created sip into the cached stats and re-render.
+
+        Avoids re-running the daily aggregate query after every click;
+        the periodic refresh still reconciles from the DB.
+
+        Args:
+            sip_event: The sip event that was just persisted
+        """
+        today = self._today
+        if today is None:
+            self.refresh_data()
+            return
 
+        today.total_ml += sip_event.ml_estimate
+        today.total_sips += 1
+        today.total_cups = today.total_ml / 250.0
+        if today.goal_ml > 0:
+            today.progress_percentage = today.total_ml / today.goal_ml * 100
+        today.goal_achieved = today.total_ml >= today.goal_ml
+        today.events.append(sip_event)
+
+        self.populate(today)
+
+    def _queue_sip(self, sip_event) -> None:
+        """Queue a sip event for a batched write and render it now.
+
+        Args:
+            sip_event: The sip event to persist
+        """
+        self._pending.append(sip_event)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+        self._apply_local_sip(sip_event)
+
+    def _flush_pending(self) -> None:
+        """Flush queued sip events to the DB in one transaction."""
+        self._flush_timer.stop()
+        if not self._pending or not self.database:
+            return
+
+        events, self._pending = self._pending, []
+        try:
+            self.database.create_sip_events_many(events)
         except Exception as e:
-            logger.error(f"Failed to refresh dashboard data: {e}")
+            logger.error(f"Failed to persist queued sip events: {e}")
 
     def _update_activity_list(self, events) -> None:
         """Update the recent activity list.
@@ -273,40 +392,27 @@ class DashboardScreen(QWidget):
         Args:
             events: List of recent sip events
         """
-        if not hasattr(self, "activity_layout"):
+        texts = [
+            f"{event.timestamp.strftime('%H:%M')} - {event.ml_estimate:.0f}ml sip"
+            for event in events[-5:]  # Show last 5 events
+        ]
+        if texts == self._last_activity_texts:
             return
+        self._last_activity_texts = texts
 
-        # Clear existing activity items
-        for i in reversed(range(self.activity_layout.count())):
-            child = self.activity_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
+        self.no_activity_label.setVisible(not texts)
 
-        if not events:
-            no_activity = QLabel("No recent activity")
-            no_activity.setStyleSheet("color: #d0d0d0; font-size: 14px; padding: 8px;")
-            self.activity_layout.addWidget(no_activity)
-            return
-
-        # Add recent events
-        for event in events[-5:]:  # Show last 5 events
-            event_text = (
-                f"{event.timestamp.strftime('%H:%M')} - {event.ml_estimate:.0f}ml sip"
-            )
-            event_label = QLabel(event_text)
-            event_label.setStyleSheet(
-                "color: #ffffff; font-size: 12px; padding: 4px; background-color: #2a2a2a; border-radius: 4px; margin: 2px;"
-            )
-            self.activity_layout.addWidget(event_label)
+        # Recycle pooled labels; hide the unused tail
+        for event_label, event_text in zip(self._activity_pool, texts, strict=False):
+            event_label.setText(event_text)
+            event_label.show()
+        for event_label in self._activity_pool[len(texts) :]:
+            event_label.hide()
 
     def _add_sip(self) -> None:
         """Add a sip manually."""
         if self.database:
             # Create manual sip event
-            from datetime import datetime
-
-            from app.core.models import EventSource, SipEvent
-
             sip_event = SipEvent(
                 timestamp=datetime.now(),
                 profile_id=1,  # Default profile
@@ -315,22 +421,14 @@ class DashboardScreen(QWidget):
                 confidence=1.0,
             )
 
-            try:
-                self.database.create_sip_event(sip_event)
-                self.refresh_data()
-                self.sip_detected.emit(20.0)
-                logger.info("Manual sip added: 20ml")
-            except Exception as e:
-                logger.error(f"Failed to add manual sip: {e}")
+            self._queue_sip(sip_event)
+            self.sip_detected.emit(20.0)
+            logger.info("Manual sip added: 20ml")
 
     def _add_cup(self) -> None:
         """Add a cup manually."""
         if self.database:
             # Create manual sip event
-            from datetime import datetime
-
-            from app.core.models import EventSource, SipEvent
-
             sip_event = SipEvent(
                 timestamp=datetime.now(),
                 profile_id=1,  # Default profile
@@ -339,18 +437,12 @@ class DashboardScreen(QWidget):
                 confidence=1.0,
             )
 
-            try:
-                self.database.create_sip_event(sip_event)
-                self.refresh_data()
-                self.sip_detected.emit(250.0)
-                logger.info("Manual cup added: 250ml")
-            except Exception as e:
-                logger.error(f"Failed to add manual cup: {e}")
+            self._queue_sip(sip_event)
+            self.sip_detected.emit(250.0)
+            logger.info("Manual cup added: 250ml")
 
     def _reset_today(self) -> None:
         """Reset today's statistics."""
-        from PyQt6.QtWidgets import QMessageBox
-
         reply = QMessageBox.question(
             self,
             "Reset Today",
@@ -365,5 +457,6 @@ class DashboardScreen(QWidget):
 
     def cleanup(self) -> None:
         """Clean up resources."""
+        self._flush_pending()
         if hasattr(self, "refresh_timer"):
             self.refresh_timer.stop()
@@ -1,8 +1,17 @@
 """History screen for Count-Cups."""
 
-from datetime import timedelta
-
-from PyQt6.QtCore import QDate
+import numpy as np
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QDate,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtWidgets import (
     QComboBox,
     QDateEdit,
@@ -10,18 +19,121 @@ from PyQt6.QtWidgets import (
     QHeaderView,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from app.core.db import Database
 from app.core.logging import get_logger
+from app.core.models import DailyStats
 
 logger = get_logger(__name__)
 
 
+class _RangeFetchSignals(QObject):
+    """Signals for background range fetches."""
+
+    finished = pyqtSignal(int, object)
+
+
+class _RangeFetcher(QRunnable):
+    """Fetches a date range of daily stats off the GUI thread."""
+
+    def __init__(self, database, start_date, end_date, seq):
+        """Initialize fetcher.
+
+        Args:
+            database: Database instance
+            start_date: First day of the range
+            end_date: Last day of the range
+            seq: Sequence number used to discard stale results
+        """
+        super().__init__()
+        self.database = database
+        self.start_date = start_date
+        self.end_date = end_date
+        self.seq = seq
+        self.signals = _RangeFetchSignals()
+
+    def run(self) -> None:
+        """Run the range query and hand the rows back to the GUI thread."""
+        try:
+            stats = self.database.get_daily_stats_range(self.start_date, self.end_date)
+            self.signals.finished.emit(self.seq, list(stats.values()))
+        except Exception as e:
+            logger.error(f"Failed to load historical data: {e}")
+            self.signals.finished.emit(self.seq, None)
+
+
+class DailyStatsModel(QAbstractTableModel):
+    """Table model over a list of daily statistics.
+
+    Stores plain DailyStats rows and formats cells on paint, avoiding
+    one QTableWidgetItem allocation per cell on every refresh.
+    """
+
+    HEADERS = ("Date", "Total ML", "Total Cups", "Total Sips", "Goal ML", "Achieved")
+
+    def __init__(self, parent=None):
+        """Initialize the model.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._rows: list[DailyStats] = []
+
+    def set_rows(self, rows: list[DailyStats]) -> None:
+        """Replace the model contents.
+
+        Args:
+            rows: Daily statistics to display
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Get number of rows."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Get number of columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Get cell data for display."""
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+
+        stats = self._rows[index.row()]
+        column = index.column()
+
+        if column == 0:
+            # isoformat takes the C fast path; strftime re-parses its
+            # format string per call
+            return stats.date.date().isoformat()
+        if column == 1:
+            return f"{stats.total_ml:.0f}"
+        if column == 2:
+            return f"{stats.total_cups:.1f}"
+        if column == 3:
+            return str(stats.total_sips)
+        if column == 4:
+            return str(stats.goal_ml)
+        return "Yes" if stats.goal_achieved else "No"
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Get header labels."""
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self.HEADERS[section]
+        return None
+
+
 class HistoryScreen(QWidget):
     """History screen showing past water intake data."""
 
@@ -35,6 +147,7 @@ class HistoryScreen(QWidget):
         super().__init__(parent)
         self.database = database
         self.parent_window = parent
+        self._fetch_seq = 0
 
         self._init_ui()
         self._load_data()
@@ -50,19 +163,26 @@ class HistoryScreen(QWidget):
         title.setProperty("class", "title")
         layout.addWidget(title)
 
+        # Debounce filter edits so typing a date triggers one reload
+        # instead of one per keystroke
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(250)
+        self._reload_timer.timeout.connect(self._load_data)
+
         # Filters
         filters_layout = QHBoxLayout()
 
         filters_layout.addWidget(QLabel("From:"))
         self.start_date = QDateEdit()
         self.start_date.setDate(QDate.currentDate().addDays(-30))
-        self.start_date.dateChanged.connect(self._load_data)
+        self.start_date.dateChanged.connect(self._reload_timer.start)
         filters_layout.addWidget(self.start_date)
 
         filters_layout.addWidget(QLabel("To:"))
         self.end_date = QDateEdit()
         self.end_date.setDate(QDate.currentDate())
-        self.end_date.dateChanged.connect(self._load_data)
+        self.end_date.dateChanged.connect(self._reload_timer.start)
         filters_layout.addWidget(self.end_date)
 
         self.period_combo = QComboBox()
@@ -80,17 +200,15 @@ class HistoryScreen(QWidget):
         layout.addLayout(filters_layout)
 
         # Data table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(
-            ["Date", "Total ML", "Total Cups", "Total Sips", "Goal ML", "Achieved"]
-        )
+        self.model = DailyStatsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         # Set table properties
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
 
         layout.addWidget(self.table)
 
@@ -119,44 +237,40 @@ class HistoryScreen(QWidget):
         # Custom period - don't change dates
 
     def _load_data(self) -> None:
-        """Load historical data."""
+        """Load historical data on a background thread."""
         if not self.database:
             return
 
-        try:
-            start_date = self.start_date.date().toPyDate()
-            end_date = self.end_date.date().toPyDate()
-
-            # Get daily stats for the period
-            daily_stats = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                stats = self.database.get_daily_stats(current_date)
-                daily_stats.append(stats)
-                current_date += timedelta(days=1)
-
-            # Populate table
-            self.table.setRowCount(len(daily_stats))
-
-            for row, stats in enumerate(daily_stats):
-                self.table.setItem(
-                    row, 0, QTableWidgetItem(stats.date.strftime("%Y-%m-%d"))
-                )
-                self.table.setItem(row, 1, QTableWidgetItem(f"{stats.total_ml:.0f}"))
-                self.table.setItem(row, 2, QTableWidgetItem(f"{stats.total_cups:.1f}"))
-                self.table.setItem(row, 3, QTableWidgetItem(str(stats.total_sips)))
-                self.table.setItem(row, 4, QTableWidgetItem(f"{stats.goal_ml}"))
-                self.table.setItem(
-                    row, 5, QTableWidgetItem("Yes" if stats.goal_achieved else "No")
-                )
-
-            # Update summary
-            self._update_summary(daily_stats)
+        start_date = self.start_date.date().toPyDate()
+        end_date = self.end_date.date().toPyDate()
 
-        except Exception as e:
-            logger.error(f"Failed to load historical data: {e}")
-            self.summary_label.setText(f"Error loading data: {e}")
+        # Run the range query off the GUI thread; the sequence number
+        # lets _on_data_loaded ignore results from superseded fetches
+        self._fetch_seq += 1
+        fetcher = _RangeFetcher(self.database, start_date, end_date, self._fetch_seq)
+        fetcher.signals.finished.connect(self._on_data_loaded)
+        QThreadPool.globalInstance().start(fetcher)
+
+    def _on_data_loaded(self, seq, daily_stats) -> None:
+        """Render fetched rows on the GUI thread.
+
+        Args:
+            seq: Sequence number of the originating fetch
+            daily_stats: Fetched rows, or None if the query failed
+        """
+        if seq != self._fetch_seq:
+            return
+
+        if daily_stats is None:
+            self.summary_label.setText("Error loading data")
+            return
+
+        # Populate table through the model; a single reset replaces
+        # per-cell item churn
+        self.model.set_rows(daily_stats)
+
+        # Update summary
+        self._update_summary(daily_stats)
 
     def _update_summary(self, daily_stats) -> None:
         """Update summary statistics.
@@ -168,13 +282,25 @@ class HistoryScreen(QWidget):
             self.summary_label.setText("No data available")
             return
 
-        total_ml = sum(stats.total_ml for stats in daily_stats)
-        total_cups = sum(stats.total_cups for stats in daily_stats)
-        total_sips = sum(stats.total_sips for stats in daily_stats)
-        goal_achieved_days = sum(1 for stats in daily_stats if stats.goal_achieved)
+        # Gather the columns into flat arrays (SoA) so the totals and
+        # averages are one vectorized reduction each
+        count = len(daily_stats)
+        ml = np.fromiter((s.total_ml for s in daily_stats), dtype=np.float64, count=count)
+        cups = np.fromiter(
+            (s.total_cups for s in daily_stats), dtype=np.float64, count=count
+        )
+        sips = np.fromiter(
+            (s.total_sips for s in daily_stats), dtype=np.int64, count=count
+        )
+        achieved = np.fromiter(
+            (s.goal_achieved for s in daily_stats), dtype=np.bool_, count=count
+        )
 
-        avg_daily_ml = total_ml / len(daily_stats)
-        goal_achievement_rate = (goal_achieved_days / len(daily_stats)) * 100
+        total_ml = ml.sum()
+        total_cups = cups.sum()
+        total_sips = int(sips.sum())
+        avg_daily_ml = ml.mean()
+        goal_achievement_rate = achieved.mean() * 100
 
         summary_text = (
             f"Period Summary: {total_ml:.0f}ml total, {total_cups:.1f} cups, {total_sips} sips | "
@@ -1,6 +1,6 @@
 """Settings screen for Count-Cups."""
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QSignalBlocker, Qt, pyqtSignal
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -18,6 +18,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from app.core import camera_registry
 from app.core.db import Database
 from app.core.logging import get_logger
 
@@ -41,6 +42,7 @@ class SettingsScreen(QWidget):
         super().__init__(parent)
         self.database = database
         self.parent_window = parent
+        self._settings = None
 
         self._init_ui()
         self._load_settings()
@@ -56,24 +58,28 @@ class SettingsScreen(QWidget):
         title.setProperty("class", "title")
         layout.addWidget(title)
 
-        # Create tab widget
+        # Create tab widget. Tab pages are placeholders built lazily on
+        # first activation, so opening the screen doesn't pay for form
+        # layouts (and the camera probe) the user may never look at
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
 
-        # General Settings Tab
-        self._create_general_tab()
+        self._tab_builders = {
+            0: self._create_general_tab,
+            1: self._create_detection_tab,
+            2: self._create_camera_tab,
+            3: self._create_notifications_tab,
+            4: self._create_advanced_tab,
+        }
+        self._tab_built: set[int] = set()
 
-        # Detection Settings Tab
-        self._create_detection_tab()
+        for label in ("General", "Detection", "Camera", "Notifications", "Advanced"):
+            self.tab_widget.addTab(QWidget(), label)
 
-        # Camera Settings Tab
-        self._create_camera_tab()
+        self.tab_widget.currentChanged.connect(self._build_tab_if_needed)
 
-        # Notifications Tab
-        self._create_notifications_tab()
-
-        # Advanced Tab
-        self._create_advanced_tab()
+        # The initial tab is built eagerly so the screen is never blank
+        self._build_tab_if_needed(0)
 
         # Action buttons
         buttons_layout = QHBoxLayout()
@@ -91,9 +97,30 @@ class SettingsScreen(QWidget):
         buttons_layout.addStretch()
         layout.addLayout(buttons_layout)
 
-    def _create_general_tab(self) -> None:
-        """Create general settings tab."""
-        tab = QWidget()
+    def _build_tab_if_needed(self, index: int) -> None:
+        """Build a tab's contents on first activation.
+
+        Args:
+            index: Tab index that became current
+        """
+        if index in self._tab_built:
+            return
+
+        self._tab_built.add(index)
+        self._tab_builders[index](self.tab_widget.widget(index))
+        self._apply_settings_to_tab(index)
+
+    def _build_all_tabs(self) -> None:
+        """Build every remaining tab (needed before bulk reads/writes)."""
+        for index in self._tab_builders:
+            self._build_tab_if_needed(index)
+
+    def _create_general_tab(self, tab: QWidget) -> None:
+        """Create general settings tab.
+
+        Args:
+            tab: Placeholder page to populate
+        """
         layout = QVBoxLayout(tab)
         layout.setSpacing(20)
 
@@ -128,11 +155,13 @@ class SettingsScreen(QWidget):
         layout.addWidget(window_group)
 
         layout.addStretch()
-        self.tab_widget.addTab(tab, "General")
 
-    def _create_detection_tab(self) -> None:
-        """Create detection settings tab."""
-        tab = QWidget()
+    def _create_detection_tab(self, tab: QWidget) -> None:
+        """Create detection settings tab.
+
+        Args:
+            tab: Placeholder page to populate
+        """
         layout = QVBoxLayout(tab)
         layout.setSpacing(20)
 
@@ -186,11 +215,13 @@ class SettingsScreen(QWidget):
         layout.addWidget(params_group)
 
         layout.addStretch()
-        self.tab_widget.addTab(tab, "Detection")
 
-    def _create_camera_tab(self) -> None:
-        """Create camera settings tab."""
-        tab = QWidget()
+    def _create_camera_tab(self, tab: QWidget) -> None:
+        """Create camera settings tab.
+
+        Args:
+            tab: Placeholder page to populate
+        """
         layout = QVBoxLayout(tab)
         layout.setSpacing(20)
 
@@ -246,11 +277,13 @@ class SettingsScreen(QWidget):
         layout.addWidget(test_group)
 
         layout.addStretch()
-        self.tab_widget.addTab(tab, "Camera")
 
-    def _create_notifications_tab(self) -> None:
-        """Create notifications settings tab."""
-        tab = QWidget()
+    def _create_notifications_tab(self, tab: QWidget) -> None:
+        """Create notifications settings tab.
+
+        Args:
+            tab: Placeholder page to populate
+        """
         layout = QVBoxLayout(tab)
         layout.setSpacing(20)
 
@@ -289,11 +322,13 @@ class SettingsScreen(QWidget):
         layout.addWidget(test_group)
 
         layout.addStretch()
-        self.tab_widget.addTab(tab, "Notifications")
 
-    def _create_advanced_tab(self) -> None:
-        """Create advanced settings tab."""
-        tab = QWidget()
+    def _create_advanced_tab(self, tab: QWidget) -> None:
+        """Create advanced settings tab.
+
+        Args:
+            tab: Placeholder page to populate
+        """
         layout = QVBoxLayout(tab)
         layout.setSpacing(20)
 
@@ -351,7 +386,6 @@ class SettingsScreen(QWidget):
         layout.addWidget(reset_group)
 
         layout.addStretch()
-        self.tab_widget.addTab(tab, "Advanced")
 
     def _load_settings(self) -> None:
         """Load settings from database."""
@@ -359,34 +393,73 @@ class SettingsScreen(QWidget):
             return
 
         try:
-            settings = self.database.get_user_settings()
+            self._settings = self.database.get_user_settings()
+        except Exception as e:
+            logger.error(f"Failed to load settings: {e}")
+            return
 
-            # General settings
-            self.theme_combo.setCurrentText(settings.theme.title())
-            self.start_maximized.setChecked(settings.window_maximized)
+        for index in sorted(self._tab_built):
+            self._apply_settings_to_tab(index)
+
+    def _apply_settings_to_tab(self, index: int) -> None:
+        """Set one tab's widgets from the loaded settings.
 
-            # Detection settings
-            self.detection_engine.setCurrentText(settings.detection_engine.title())
+        Change signals are blocked while widgets are set from the
+        database: otherwise every setValue/setCurrentText fires its
+        slot, re-emitting theme/engine changes and re-syncing the
+        camera combo on every settings load.
 
-            # Camera settings
+        Args:
+            index: Built tab index to populate
+        """
+        settings = self._settings
+        if settings is None:
+            return
+
+        if index == 0:
+            blockers = [
+                QSignalBlocker(w) for w in (self.theme_combo, self.start_maximized)
+            ]
+            self.theme_combo.setCurrentText(settings.theme.title())
+            self.start_maximized.setChecked(settings.window_maximized)
+            del blockers
+        elif index == 1:
+            with QSignalBlocker(self.detection_engine):
+                self.detection_engine.setCurrentText(settings.detection_engine.title())
+        elif index == 2:
+            blockers = [
+                QSignalBlocker(w)
+                for w in (
+                    self.camera_combo,
+                    self.camera_index,
+                    self.camera_width,
+                    self.camera_height,
+                    self.camera_fps,
+                )
+            ]
             self.camera_index.setValue(settings.camera_index)
             self.camera_width.setValue(settings.camera_width)
             self.camera_height.setValue(settings.camera_height)
             self.camera_fps.setValue(settings.camera_fps)
-
-            # Notification settings
+            del blockers
+        elif index == 3:
+            blockers = [
+                QSignalBlocker(w)
+                for w in (
+                    self.enable_notifications,
+                    self.reminder_hour,
+                    self.reminder_minute,
+                )
+            ]
             self.enable_notifications.setChecked(settings.enable_notifications)
             self.reminder_hour.setValue(settings.goal_reminder_hour)
             self.reminder_minute.setValue(settings.goal_reminder_minute)
-
-            # Database path
+            del blockers
+        elif index == 4:
             from app.core.config import settings as app_settings
 
             self.db_path.setText(str(app_settings.get_database_path()))
 
-        except Exception as e:
-            logger.error(f"Failed to load settings: {e}")
-
     def _on_theme_changed(self, theme: str) -> None:
         """Handle theme change.
 
@@ -420,20 +493,28 @@ class SettingsScreen(QWidget):
         )
 
     def _populate_camera_list(self) -> None:
-        """Populate camera list with available cameras."""
+        """Populate camera list with available cameras.
+
+        Probing opens real device handles and can block for seconds, so
+        it runs on the thread pool and fills the combo when done.
+        """
         self.camera_combo.clear()
         self.camera_combo.addItem("Auto-detect", -1)
 
-        try:
-            import cv2
-
-            for i in range(5):  # Check first 5 camera indices
-                cap = cv2.VideoCapture(i)
-                if cap.isOpened():
-                    self.camera_combo.addItem(f"Camera {i}", i)
-                cap.release()
-        except ImportError:
+        if camera_registry.cv2 is None:
             self.camera_combo.addItem("OpenCV not available", -1)
+            return
+
+        camera_registry.probe_async(self._on_cameras_found)
+
+    def _on_cameras_found(self, indices: list) -> None:
+        """Add probed cameras to the combo on the GUI thread.
+
+        Args:
+            indices: Working camera indices
+        """
+        for i in indices:
+            self.camera_combo.addItem(f"Camera {i}", i)
 
     def _on_camera_selected(self, text: str) -> None:
         """Handle camera selection."""
@@ -480,6 +561,9 @@ class SettingsScreen(QWidget):
                 QMessageBox.warning(self, "Error", "Database not available.")
                 return
 
+            # Saving reads widgets from every tab
+            self._build_all_tabs()
+
             # Get current settings
             settings = self.database.get_user_settings()
 
@@ -523,6 +607,9 @@ class SettingsScreen(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
+            # Resetting writes widgets on every tab
+            self._build_all_tabs()
+
             # Reset to default values
             self.theme_combo.setCurrentText("Auto")
             self.start_maximized.setChecked(False)
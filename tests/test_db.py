@@ -1,6 +1,6 @@
 """Tests for database operations."""
 
-import tempfile
+import shutil
 from datetime import date, datetime
 from pathlib import Path
 
@@ -16,22 +16,41 @@ from app.core.models import (
 )
 
 
+@pytest.fixture(scope="session")
+def db_template(tmp_path_factory):
+    """Create a fully migrated database file once per session.
+
+    Migrations are versioned, so tests get a fresh copy of this file
+    instead of re-running schema setup for every test.
+    """
+    template_path = tmp_path_factory.mktemp("db_template") / "template.db"
+    Database(template_path).close()
+    return template_path
+
+
 class TestDatabase:
     """Test database functionality."""
 
     @pytest.fixture
     def temp_db(self):
-        """Create temporary database for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            db_path = Path(temp_dir) / "test.db"
-            db = Database(db_path)
-            yield db
-            db.close()
-
-    def test_init(self, temp_db):
+        """Create in-memory database for testing."""
+        db = Database(Path(":memory:"))
+        yield db
+        db.close()
+
+    @pytest.fixture
+    def file_db(self, db_template, tmp_path):
+        """Create a file-backed database from the session template."""
+        db_path = tmp_path / "test.db"
+        shutil.copyfile(db_template, db_path)
+        db = Database(db_path)
+        yield db
+        db.close()
+
+    def test_init(self, file_db):
         """Test database initialization."""
-        assert temp_db.db_path.exists()
-        assert temp_db.connection is not None
+        assert file_db.db_path.exists()
+        assert file_db.connection is not None
 
     def test_create_cup_profile(self, temp_db):
         """Test creating cup profile."""
@@ -146,8 +165,35 @@ class TestDatabase:
         assert event_id is not None
         assert event_id > 0
 
-    def test_get_sip_events(self, temp_db):
-        """Test getting sip events."""
+    def test_create_sip_events_many(self, temp_db):
+        """Test creating multiple sip events in one transaction."""
+        # Create cup profile first
+        profile = CupProfile(name="Test Cup", size_ml=250, sips_per_cup=10)
+        profile_id = temp_db.create_cup_profile(profile)
+
+        # Create a batch of sip events
+        events = [
+            SipEvent(
+                timestamp=datetime.now(),
+                profile_id=profile_id,
+                ml_estimate=float(ml),
+                source=EventSource.MANUAL,
+            )
+            for ml in (20, 25, 30)
+        ]
+
+        temp_db.create_sip_events_many(events)
+
+        stored = temp_db.get_sip_events()
+        assert len(stored) == 3
+        assert sorted(e.ml_estimate for e in stored) == [20.0, 25.0, 30.0]
+
+        # Empty batches are a no-op
+        temp_db.create_sip_events_many([])
+
+    @pytest.mark.parametrize("query", ["all", "by_profile", "by_date"])
+    def test_get_sip_events(self, temp_db, query):
+        """Test getting sip events by each supported query."""
         # Create cup profile
         profile = CupProfile(name="Test Cup", size_ml=250, sips_per_cup=10)
         profile_id = temp_db.create_cup_profile(profile)
@@ -169,22 +215,20 @@ class TestDatabase:
         temp_db.create_sip_event(event1)
         temp_db.create_sip_event(event2)
 
-        # Get all events
-        events = temp_db.get_sip_events()
-        assert len(events) == 2
-
-        # Get events by profile
-        profile_events = temp_db.get_sip_events(profile_id=profile_id)
-        assert len(profile_events) == 2
+        if query == "all":
+            events = temp_db.get_sip_events()
+        elif query == "by_profile":
+            events = temp_db.get_sip_events(profile_id=profile_id)
+        else:
+            start_date = datetime.now().replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            end_date = datetime.now().replace(
+                hour=23, minute=59, second=59, microsecond=999999
+            )
+            events = temp_db.get_sip_events(start_date=start_date, end_date=end_date)
 
-        # Get events by date range
-        start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        end_date = datetime.now().replace(
-            hour=23, minute=59, second=59, microsecond=999999
-        )
-
-        date_events = temp_db.get_sip_events(start_date=start_date, end_date=end_date)
-        assert len(date_events) == 2
+        assert len(events) == 2
 
     def test_get_or_create_daily_goal(self, temp_db):
         """Test getting or creating daily goal."""
@@ -259,6 +303,70 @@ class TestDatabase:
         assert stats.total_cups == 0.22  # 55ml / 250ml per cup
         assert len(stats.events) == 2
 
+    def test_get_daily_stats_cache_invalidated_on_write(self, temp_db):
+        """Test that cached daily stats are evicted when the day changes."""
+        # Create cup profile
+        profile = CupProfile(name="Test Cup", size_ml=250, sips_per_cup=10)
+        profile_id = temp_db.create_cup_profile(profile)
+
+        today = date.today()
+        stats = temp_db.get_daily_stats(today)
+        assert stats.total_sips == 0
+
+        # Repeated reads hit the cache
+        assert temp_db.get_daily_stats(today) is stats
+
+        # A write to the day evicts its entry
+        event = SipEvent(
+            timestamp=datetime.combine(today, datetime.min.time()),
+            profile_id=profile_id,
+            ml_estimate=25.0,
+            source=EventSource.MANUAL,
+        )
+        temp_db.create_sip_event(event)
+
+        refreshed = temp_db.get_daily_stats(today)
+        assert refreshed is not stats
+        assert refreshed.total_sips == 1
+
+    def test_get_daily_stats_range(self, temp_db):
+        """Test getting daily statistics for a date range."""
+        from datetime import timedelta
+
+        # Create cup profile
+        profile = CupProfile(name="Test Cup", size_ml=250, sips_per_cup=10)
+        profile_id = temp_db.create_cup_profile(profile)
+
+        # Create sip events on the first and last day
+        today = date.today()
+        start = today - timedelta(days=2)
+        event1 = SipEvent(
+            timestamp=datetime.combine(start, datetime.min.time()),
+            profile_id=profile_id,
+            ml_estimate=25.0,
+            source=EventSource.AUTO,
+        )
+        event2 = SipEvent(
+            timestamp=datetime.combine(today, datetime.min.time()),
+            profile_id=profile_id,
+            ml_estimate=30.0,
+            source=EventSource.MANUAL,
+        )
+
+        temp_db.create_sip_event(event1)
+        temp_db.create_sip_event(event2)
+
+        # Get stats for the range
+        stats = temp_db.get_daily_stats_range(start, today)
+
+        assert list(stats.keys()) == [start, start + timedelta(days=1), today]
+        assert stats[start].total_ml == 25.0
+        assert stats[start].total_sips == 1
+        # Middle day has no events and is zero-filled
+        assert stats[start + timedelta(days=1)].total_ml == 0.0
+        assert stats[start + timedelta(days=1)].total_sips == 0
+        assert stats[today].total_ml == 30.0
+
     def test_get_user_settings(self, temp_db):
         """Test getting user settings."""
         settings = temp_db.get_user_settings()
@@ -270,6 +378,21 @@ class TestDatabase:
         assert settings.window_width == 1200
         assert settings.window_height == 800
 
+    def test_get_user_settings_cached_until_update(self, temp_db):
+        """Test that user settings are cached and refreshed on update."""
+        settings = temp_db.get_user_settings()
+
+        # Repeated reads hit the cache
+        assert temp_db.get_user_settings() is settings
+
+        # An update evicts the cached row
+        settings.window_width = 1600
+        assert temp_db.update_user_settings(settings) is True
+
+        refreshed = temp_db.get_user_settings()
+        assert refreshed is not settings
+        assert refreshed.window_width == 1600
+
     def test_update_user_settings(self, temp_db):
         """Test updating user settings."""
         # Get current settings
@@ -0,0 +1,96 @@
+"""Tests for the scheduling service."""
+
+from datetime import datetime, timedelta
+from datetime import time as dt_time
+
+from app.services.scheduler import Scheduler
+
+
+class TestScheduler:
+    """Test scheduler functionality."""
+
+    def test_auto_generated_ids_are_unique(self):
+        """Test that auto-generated task IDs never collide."""
+        scheduler = Scheduler()
+        run_time = datetime.now() + timedelta(hours=1)
+
+        id1 = scheduler.schedule_once(lambda: None, run_time)
+        id2 = scheduler.schedule_once(lambda: None, run_time)
+        id3 = scheduler.schedule_daily(lambda: None, dt_time(12, 0))
+        id4 = scheduler.schedule_daily(lambda: None, dt_time(12, 0))
+        id5 = scheduler.schedule_interval(lambda: None, 60)
+        id6 = scheduler.schedule_interval(lambda: None, 60)
+
+        assert len({id1, id2, id3, id4, id5, id6}) == 6
+        assert scheduler.get_task_count() == 6
+
+    def test_get_tasks_returns_read_only_view(self):
+        """Test that get_tasks returns a live read-only view."""
+        scheduler = Scheduler()
+        scheduler.schedule_interval(lambda: None, 60, "tick")
+
+        tasks = scheduler.get_tasks()
+        assert "tick" in tasks
+
+        try:
+            tasks["other"] = {}
+            raised = False
+        except TypeError:
+            raised = True
+        assert raised is True
+
+        # View reflects later mutations without re-fetching
+        scheduler.schedule_interval(lambda: None, 30, "tock")
+        assert "tock" in tasks
+
+    def test_daily_tasks_share_heap_entry(self):
+        """Test that daily tasks at the same time share one heap entry."""
+        scheduler = Scheduler()
+        scheduler.schedule_daily(lambda: None, dt_time(9, 0), "a")
+        scheduler.schedule_daily(lambda: None, dt_time(9, 0), "b")
+        scheduler.schedule_daily(lambda: None, dt_time(21, 0), "c")
+
+        assert len(scheduler._daily_heap) == 2
+        assert len(scheduler._daily_buckets[dt_time(9, 0)]) == 2
+
+    def test_daily_bucket_dispatch(self):
+        """Test that due daily tasks dispatch together and reschedule."""
+        scheduler = Scheduler()
+        now = datetime.now()
+        scheduler.schedule_daily(lambda: None, dt_time(9, 0), "a")
+        scheduler.schedule_daily(lambda: None, dt_time(9, 0), "b")
+
+        with scheduler._lock:
+            due = scheduler._pop_due_daily_tasks(now + timedelta(days=1))
+
+        assert {task_id for task_id, _ in due} == {"a", "b"}
+        # Bucket rescheduled for the following day
+        assert len(scheduler._daily_heap) == 1
+
+    def test_cancel_daily_task_leaves_bucket(self):
+        """Test that cancelling a daily task removes it from its bucket."""
+        scheduler = Scheduler()
+        scheduler.schedule_daily(lambda: None, dt_time(9, 0), "a")
+        scheduler.schedule_daily(lambda: None, dt_time(9, 0), "b")
+
+        assert scheduler.cancel_task("a") is True
+        assert scheduler._daily_buckets[dt_time(9, 0)] == ["b"]
+        assert scheduler.cancel_task("missing") is False
+
+    def test_once_task_runs_and_is_removed(self):
+        """Test that a due one-time task executes and is removed."""
+        scheduler = Scheduler()
+        ran = []
+        scheduler.schedule_once(
+            lambda: ran.append(True), datetime.now() - timedelta(seconds=1), "now"
+        )
+
+        current_time = datetime.now()
+        with scheduler._lock:
+            due = [
+                (task_id, task)
+                for task_id, task in scheduler.tasks.items()
+                if scheduler._should_run_task(task, current_time)
+            ]
+
+        assert [task_id for task_id, _ in due] == ["now"]
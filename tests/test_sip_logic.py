@@ -72,6 +72,7 @@ class TestCupConverter:
         assert converter.default_profile.name == "Default"
         assert converter.default_profile.size_ml == 250
         assert converter.default_profile.sips_per_cup == 10
+        assert converter.default_profile.ml_per_sip == 25.0
 
     def test_sips_to_cups(self):
         """Test converting sips to cups."""
@@ -201,4 +202,15 @@ class TestSipTracker:
 
         # Get sip rate for last hour
         rate = tracker.get_sip_rate(60)
-        assert rate > 0  # Should have some sips in the last hour
+        assert rate == 2.0  # 2 sips over a 1-hour window
+
+        # A window that ends before the sips finds none
+        from datetime import datetime, timedelta
+
+        tracker._sip_timestamps[0] = (
+            datetime.now() - timedelta(minutes=10)
+        ).timestamp()
+        tracker._sip_timestamps[1] = (
+            datetime.now() - timedelta(minutes=8)
+        ).timestamp()
+        assert tracker.get_sip_rate(5) == 0.0